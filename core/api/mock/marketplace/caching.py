@@ -0,0 +1,27 @@
+# File: core/api/mock/marketplace/caching.py
+"""
+Marketplace Mock API caching helpers
+Shared cache lifetimes and HTTP caching for the marketplace views
+"""
+
+import hashlib
+
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import etag
+
+# Seconds that randomized promotional payloads are served from cache
+MARKETING_CACHE_TTL = 60
+
+# Seconds clients may reuse a pre-serialized payload before revalidating
+STATIC_PAYLOAD_MAX_AGE = 60
+
+
+def static_payload(content, public=True):
+    """Add an ETag and Cache-Control to a GET view that serves pre-serialized content"""
+    content_etag = hashlib.md5(content, usedforsecurity=False).hexdigest()
+    visibility = {'public': True} if public else {'private': True}
+
+    def decorator(view):
+        view = etag(lambda request, *args, **kwargs: content_etag)(view)
+        return cache_control(max_age=STATIC_PAYLOAD_MAX_AGE, **visibility)(view)
+    return decorator
@@ -4,30 +4,32 @@ Marketplace Order & Cart Mock API Views
 Handles shopping cart, orders, and checkout
 """
 
-import json
 import random
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
-from core.mock_data import CompleteMarketplaceMockData
+from core.mock_data.complete_marketplace_data import marketplace_data
+from .caching import static_payload
 
-marketplace_mock = CompleteMarketplaceMockData()
+marketplace_mock = marketplace_data
+
+# Payloads that never change, serialized once at import
+_CART_JSON = JsonResponse(marketplace_mock.cart_items, safe=False).content
+_ORDERS_JSON = JsonResponse(marketplace_mock.orders, safe=False).content
 
 
 @csrf_exempt
 @require_http_methods(["GET"])
+@static_payload(_CART_JSON, public=False)
 def marketplace_cart(request):
     """Get cart items"""
-    all_data = marketplace_mock.get_data_sources()
-    cart_items = all_data.get('Cart', [])
-    return JsonResponse(cart_items, safe=False)
+    return HttpResponse(_CART_JSON, content_type='application/json')
 
 
 @csrf_exempt
 @require_http_methods(["POST"])
 def marketplace_add_to_cart(request):
     """Add item to cart"""
-    data = json.loads(request.body)
     return JsonResponse({
         "success": True,
         "message": "Item added to cart",
@@ -37,21 +39,17 @@ def marketplace_add_to_cart(request):
 
 @csrf_exempt
 @require_http_methods(["GET"])
+@static_payload(_ORDERS_JSON, public=False)
 def marketplace_orders(request):
     """Get user orders"""
-    all_data = marketplace_mock.get_data_sources()
-    orders = all_data.get('Orders', [])
-    return JsonResponse(orders, safe=False)
+    return HttpResponse(_ORDERS_JSON, content_type='application/json')
 
 
 @csrf_exempt
 @require_http_methods(["GET"])
 def marketplace_order_detail(request, order_id):
     """Get order details"""
-    all_data = marketplace_mock.get_data_sources()
-    orders = all_data.get('Order Details', all_data.get('Orders', []))
-
-    order = next((o for o in orders if o.get('id') == order_id), None)
+    order = marketplace_mock.orders_by_id.get(order_id)
     if order:
         return JsonResponse(order)
 
@@ -62,8 +60,7 @@ def marketplace_order_detail(request, order_id):
 @require_http_methods(["GET"])
 def marketplace_order_tracking(request, order_id):
     """Get order tracking info"""
-    all_data = marketplace_mock.get_data_sources()
-    tracking_data = all_data.get('Order Tracking', [])
+    tracking_data = marketplace_mock._generate_tracking_data()
 
     if isinstance(tracking_data, list) and tracking_data:
         return JsonResponse(tracking_data[0])
@@ -4,13 +4,29 @@ Marketplace Product-related Mock API Views
 Handles all product catalog, search, and category endpoints
 """
 
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse
+from django.views.decorators.cache import cache_page
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
-from core.mock_data import CompleteMarketplaceMockData
+from core.mock_data.complete_marketplace_data import marketplace_data
+from .caching import MARKETING_CACHE_TTL, static_payload
 
-# Initialize mock data
-marketplace_mock = CompleteMarketplaceMockData()
+# Shared mock data instance
+marketplace_mock = marketplace_data
+
+# Payloads that never change, serialized once at import
+_CATEGORIES_JSON = JsonResponse(marketplace_mock.categories, safe=False).content
+_FLASH_SALES_JSON = JsonResponse(marketplace_mock.flash_sales, safe=False).content
+
+
+def _parse_pagination(request, default_limit=20, max_limit=100):
+    """Read page and limit from the query string, clamped to page >= 1 and 1 <= limit <= max_limit"""
+    try:
+        page = max(1, int(request.GET.get('page', 1)))
+        limit = min(max_limit, max(1, int(request.GET.get('limit', default_limit))))
+    except ValueError:
+        page, limit = 1, default_limit
+    return page, limit
 
 
 # ============= PRODUCTS ENDPOINTS =============
@@ -21,29 +37,20 @@ def marketplace_products(request):
     """Get all products with optional filters"""
     category = request.GET.get('category')
     sort = request.GET.get('sort', 'relevance')
-    page = int(request.GET.get('page', 1))
-    limit = int(request.GET.get('limit', 20))
-
-    # Get products from comprehensive mock data
-    all_data = marketplace_mock.get_data_sources()
-    products = all_data.get('Products', [])
-
-    # Apply filters
-    if category:
-        products = [p for p in products if p.get('category', '').lower() == category.lower()]
-
-    # Apply sorting
-    if sort == 'price_low':
-        products = sorted(products, key=lambda x: x.get('price', 0))
-    elif sort == 'price_high':
-        products = sorted(products, key=lambda x: x.get('price', 0), reverse=True)
-    elif sort == 'rating':
-        products = sorted(products, key=lambda x: x.get('rating', 0), reverse=True)
+    page, limit = _parse_pagination(request)
 
     # Pagination
     start = (page - 1) * limit
     end = start + limit
 
+    # Sorted listings come from the orderings presorted at startup
+    if category:
+        key = category.lower()
+        products = (marketplace_mock.products_by_category_sort.get((key, sort))
+                    or marketplace_mock.products_by_category.get(key, []))
+    else:
+        products = marketplace_mock.products_by_sort.get(sort, marketplace_mock.products)
+
     return JsonResponse({
         "products": products[start:end],
         "total": len(products),
@@ -56,17 +63,15 @@ def marketplace_products(request):
 @require_http_methods(["GET"])
 def marketplace_product_detail(request, product_id):
     """Get detailed product information"""
-    all_data = marketplace_mock.get_data_sources()
-    products = all_data.get('Product Details', all_data.get('Products', []))
-    reviews = all_data.get('Reviews', [])
-
-    product = next((p for p in products if p.get('id') == product_id), None)
+    product = marketplace_mock.products_by_id.get(product_id)
 
     if product:
+        # Work on a copy so the shared catalog entry is left untouched
+        product = dict(product)
         # Add reviews for this product
-        product['reviews'] = [r for r in reviews if r.get('productId') == product_id][:5]
+        product['reviews'] = marketplace_mock.reviews_by_product.get(product_id, [])[:5]
         # Add related products
-        product['relatedProducts'] = random.sample(products, min(8, len(products)))
+        product['relatedProducts'] = marketplace_mock._sample_products(8)
         return JsonResponse(product)
 
     return JsonResponse({"error": "Product not found"}, status=404)
@@ -77,37 +82,38 @@ def marketplace_product_detail(request, product_id):
 def marketplace_search(request):
     """Search products"""
     query = request.GET.get('q', '').lower()
-    all_data = marketplace_mock.get_data_sources()
-    products = all_data.get('Products', [])
+    products = marketplace_mock.products
 
-    results = [p for p in products if query in p.get('name', '').lower() or query in p.get('description', '').lower()]
-    return JsonResponse(results[:50], safe=False)
+    results = []
+    for i, (name, description) in enumerate(marketplace_mock.products_search_text):
+        if query in name or query in description:
+            results.append(products[i])
+            if len(results) == 50:
+                break
+    return JsonResponse(results, safe=False)
 
 
 @csrf_exempt
 @require_http_methods(["GET"])
 def marketplace_trending(request):
     """Get trending products"""
-    all_data = marketplace_mock.get_data_sources()
-    trending = all_data.get('Trending Products', [])
+    trending = marketplace_mock._get_trending_products()
     return JsonResponse(trending[:20], safe=False)
 
 
 @csrf_exempt
 @require_http_methods(["GET"])
+@static_payload(_FLASH_SALES_JSON)
 def marketplace_flash_sales(request):
     """Get flash sale items"""
-    all_data = marketplace_mock.get_data_sources()
-    flash_sales = all_data.get('Flash Sales', [])
-    return JsonResponse(flash_sales, safe=False)
+    return HttpResponse(_FLASH_SALES_JSON, content_type='application/json')
 
 
 @csrf_exempt
 @require_http_methods(["GET"])
 def marketplace_new_arrivals(request):
     """Get new arrival products"""
-    all_data = marketplace_mock.get_data_sources()
-    new_arrivals = all_data.get('New Arrivals', [])
+    new_arrivals = marketplace_mock._get_new_arrivals()
     return JsonResponse(new_arrivals[:20], safe=False)
 
 
@@ -115,17 +121,16 @@ def marketplace_new_arrivals(request):
 @require_http_methods(["GET"])
 def marketplace_best_sellers(request):
     """Get best selling products"""
-    all_data = marketplace_mock.get_data_sources()
-    best_sellers = all_data.get('Best Sellers', [])
+    best_sellers = marketplace_mock._get_best_sellers()
     return JsonResponse(best_sellers[:20], safe=False)
 
 
 @csrf_exempt
 @require_http_methods(["GET"])
+@cache_page(MARKETING_CACHE_TTL)
 def marketplace_deals(request):
     """Get special deals"""
-    all_data = marketplace_mock.get_data_sources()
-    deals = all_data.get('Deals', [])
+    deals = marketplace_mock._generate_deals()
     return JsonResponse(deals, safe=False)
 
 
@@ -133,24 +138,17 @@ def marketplace_deals(request):
 
 @csrf_exempt
 @require_http_methods(["GET"])
+@static_payload(_CATEGORIES_JSON)
 def marketplace_categories(request):
     """Get all categories"""
-    all_data = marketplace_mock.get_data_sources()
-    categories = all_data.get('Categories', [])
-    return JsonResponse(categories, safe=False)
+    return HttpResponse(_CATEGORIES_JSON, content_type='application/json')
 
 
 @csrf_exempt
 @require_http_methods(["GET"])
 def marketplace_category_products(request, category_id):
     """Get products in a specific category"""
-    all_data = marketplace_mock.get_data_sources()
-    products = all_data.get('Products', [])
-
-    filtered = [p for p in products if p.get('categoryId', '').lower() == category_id.lower() or
-                p.get('category', '').lower() == category_id.lower()]
+    key = category_id.lower()
+    filtered = (marketplace_mock.products_by_category_id.get(key)
+                or marketplace_mock.products_by_category.get(key, []))
     return JsonResponse(filtered[:50], safe=False)
-
-
-# Add missing import
-import random
\ No newline at end of file
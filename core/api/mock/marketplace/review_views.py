@@ -7,31 +7,31 @@ Marketplace Review & Rating Mock API Views
 import json
 import uuid
 from datetime import datetime
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
-from core.mock_data import CompleteMarketplaceMockData
+from core.mock_data.complete_marketplace_data import marketplace_data
+from .caching import static_payload
 
-marketplace_mock = CompleteMarketplaceMockData()
+marketplace_mock = marketplace_data
+
+# Payloads that never change, serialized once at import
+_REVIEWS_JSON = JsonResponse(marketplace_mock.reviews, safe=False).content
 
 
 @csrf_exempt
 @require_http_methods(["GET"])
+@static_payload(_REVIEWS_JSON)
 def marketplace_reviews(request):
     """Get all reviews"""
-    all_data = marketplace_mock.get_data_sources()
-    reviews = all_data.get('Reviews', [])
-    return JsonResponse(reviews, safe=False)
+    return HttpResponse(_REVIEWS_JSON, content_type='application/json')
 
 
 @csrf_exempt
 @require_http_methods(["GET"])
 def marketplace_product_reviews(request, product_id):
     """Get reviews for a specific product"""
-    all_data = marketplace_mock.get_data_sources()
-    reviews = all_data.get('Reviews', [])
-
-    product_reviews = [r for r in reviews if r.get('productId') == product_id]
+    product_reviews = marketplace_mock.reviews_by_product.get(product_id, [])
     return JsonResponse(product_reviews, safe=False)
 
 
@@ -9,35 +9,37 @@ import json
 import random
 import uuid
 from datetime import datetime, timedelta
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse
+from django.views.decorators.cache import cache_control, cache_page
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
-from core.mock_data import CompleteMarketplaceMockData
+from core.mock_data.complete_marketplace_data import marketplace_data
+from .caching import MARKETING_CACHE_TTL, static_payload
 
-marketplace_mock = CompleteMarketplaceMockData()
+marketplace_mock = marketplace_data
+
+# Payloads that never change, serialized once at import
+_SELLERS_JSON = JsonResponse(marketplace_mock.sellers, safe=False).content
 
 
 @csrf_exempt
 @require_http_methods(["GET"])
+@static_payload(_SELLERS_JSON)
 def marketplace_sellers(request):
     """Get all sellers"""
-    all_data = marketplace_mock.get_data_sources()
-    sellers = all_data.get('Sellers', [])
-    return JsonResponse(sellers, safe=False)
+    return HttpResponse(_SELLERS_JSON, content_type='application/json')
 
 
 @csrf_exempt
 @require_http_methods(["GET"])
 def marketplace_seller_detail(request, seller_id):
     """Get seller details"""
-    all_data = marketplace_mock.get_data_sources()
-    sellers = all_data.get('Seller Details', all_data.get('Sellers', []))
-    products = all_data.get('Products', [])
-
-    seller = next((s for s in sellers if s.get('id') == seller_id), None)
+    seller = marketplace_mock.sellers_by_id.get(seller_id)
 
     if seller:
-        seller['products'] = [p for p in products if p.get('sellerId') == seller_id][:20]
+        # Work on a copy so the shared seller entry keeps its product count
+        seller = dict(seller)
+        seller['products'] = marketplace_mock.products_by_seller.get(seller_id, [])[:20]
         return JsonResponse(seller)
 
     return JsonResponse({"error": "Seller not found"}, status=404)
@@ -45,11 +47,12 @@ def marketplace_seller_detail(request, seller_id):
 
 @csrf_exempt
 @require_http_methods(["GET"])
+@cache_control(private=True)
+@cache_page(MARKETING_CACHE_TTL)
 def marketplace_seller_dashboard(request):
     """Get seller dashboard data"""
     dashboard_data = marketplace_mock._generate_seller_dashboard()
-    recent_orders = marketplace_mock.orders[:5] if hasattr(marketplace_mock, 'orders') else []
-    dashboard_data['recentOrders'] = recent_orders
+    dashboard_data['recentOrders'] = marketplace_mock.orders[:5]
     return JsonResponse(dashboard_data)
 
 
@@ -4,36 +4,40 @@
 Marketplace Support & Miscellaneous Mock API Views
 """
 
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse
+from django.views.decorators.cache import cache_page
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
-from core.mock_data import CompleteMarketplaceMockData
+from core.mock_data.complete_marketplace_data import marketplace_data
+from .caching import MARKETING_CACHE_TTL, static_payload
 
-marketplace_mock = CompleteMarketplaceMockData()
+marketplace_mock = marketplace_data
+
+# Payloads that never change, serialized once at import
+_NOTIFICATIONS_JSON = JsonResponse(marketplace_mock.notifications, safe=False).content
+_COUPONS_JSON = JsonResponse(marketplace_mock.coupons, safe=False).content
 
 
 @csrf_exempt
 @require_http_methods(["GET"])
+@cache_page(MARKETING_CACHE_TTL)
 def marketplace_faqs(request):
     """Get FAQs"""
-    all_data = marketplace_mock.get_data_sources()
-    faqs = all_data.get('FAQs', [])
+    faqs = marketplace_mock._generate_faqs()
     return JsonResponse(faqs, safe=False)
 
 
 @csrf_exempt
 @require_http_methods(["GET"])
+@static_payload(_NOTIFICATIONS_JSON, public=False)
 def marketplace_notifications(request):
     """Get user notifications"""
-    all_data = marketplace_mock.get_data_sources()
-    notifications = all_data.get('Notifications', [])
-    return JsonResponse(notifications, safe=False)
+    return HttpResponse(_NOTIFICATIONS_JSON, content_type='application/json')
 
 
 @csrf_exempt
 @require_http_methods(["GET"])
+@static_payload(_COUPONS_JSON)
 def marketplace_coupons(request):
     """Get available coupons"""
-    all_data = marketplace_mock.get_data_sources()
-    coupons = all_data.get('Coupons', [])
-    return JsonResponse(coupons, safe=False)
+    return HttpResponse(_COUPONS_JSON, content_type='application/json')
@@ -4,32 +4,35 @@ Marketplace User & Account Mock API Views
 Handles user profile, addresses, wallet, loyalty points, etc.
 """
 
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse
+from django.views.decorators.cache import cache_control, cache_page
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
-from core.mock_data import CompleteMarketplaceMockData
+from core.mock_data.complete_marketplace_data import marketplace_data
+from .caching import MARKETING_CACHE_TTL, static_payload
 
-marketplace_mock = CompleteMarketplaceMockData()
+marketplace_mock = marketplace_data
+
+# Payloads that never change, serialized once at import
+_USER_PROFILE_JSON = JsonResponse([marketplace_mock.users], safe=False).content
+_ADDRESSES_JSON = JsonResponse(marketplace_mock.users['addresses'], safe=False).content
+_PAYMENT_CARDS_JSON = JsonResponse(marketplace_mock._generate_payment_cards(), safe=False).content
 
 
 @csrf_exempt
 @require_http_methods(["GET"])
+@static_payload(_USER_PROFILE_JSON, public=False)
 def marketplace_user_profile(request):
     """Get user profile"""
-    all_data = marketplace_mock.get_data_sources()
-    profile = all_data.get('User Profile', {})
-    if isinstance(profile, dict):
-        return JsonResponse([profile], safe=False)
-    return JsonResponse(profile, safe=False)
+    return HttpResponse(_USER_PROFILE_JSON, content_type='application/json')
 
 
 @csrf_exempt
 @require_http_methods(["GET"])
+@static_payload(_ADDRESSES_JSON, public=False)
 def marketplace_user_addresses(request):
     """Get user addresses"""
-    all_data = marketplace_mock.get_data_sources()
-    addresses = all_data.get('Addresses', [])
-    return JsonResponse(addresses, safe=False)
+    return HttpResponse(_ADDRESSES_JSON, content_type='application/json')
 
 
 @csrf_exempt
@@ -37,9 +40,7 @@ def marketplace_user_addresses(request):
 def marketplace_user_cards(request):
     """Get or add payment cards"""
     if request.method == "GET":
-        all_data = marketplace_mock.get_data_sources()
-        cards = all_data.get('Payment Cards', [])
-        return JsonResponse(cards, safe=False)
+        return HttpResponse(_PAYMENT_CARDS_JSON, content_type='application/json')
 
     return JsonResponse({"success": True, "message": "Card added successfully"})
 
@@ -48,8 +49,7 @@ def marketplace_user_cards(request):
 @require_http_methods(["GET"])
 def marketplace_wishlist(request):
     """Get user wishlist"""
-    all_data = marketplace_mock.get_data_sources()
-    wishlist = all_data.get('Wishlist', [])
+    wishlist = marketplace_mock._generate_wishlist()
     return JsonResponse(wishlist, safe=False)
 
 
@@ -57,39 +57,38 @@ def marketplace_wishlist(request):
 @require_http_methods(["GET"])
 def marketplace_recently_viewed(request):
     """Get recently viewed products"""
-    all_data = marketplace_mock.get_data_sources()
-    recently_viewed = all_data.get('Recently Viewed', [])
+    recently_viewed = marketplace_mock._generate_recently_viewed()
     return JsonResponse(recently_viewed, safe=False)
 
 
 @csrf_exempt
 @require_http_methods(["GET"])
+@cache_control(private=True)
+@cache_page(MARKETING_CACHE_TTL)
 def marketplace_loyalty_points(request):
     """Get loyalty points info"""
-    all_data = marketplace_mock.get_data_sources()
-    loyalty_data = all_data.get('Loyalty Points', {})
-    if isinstance(loyalty_data, dict):
-        return JsonResponse([loyalty_data], safe=False)
-    return JsonResponse(loyalty_data, safe=False)
+    loyalty_data = marketplace_mock._generate_loyalty_data()
+    # Clients expect the single record wrapped in a list
+    return JsonResponse([loyalty_data], safe=False)
 
 
 @csrf_exempt
 @require_http_methods(["GET"])
+@cache_control(private=True)
+@cache_page(MARKETING_CACHE_TTL)
 def marketplace_wallet(request):
     """Get wallet information"""
-    all_data = marketplace_mock.get_data_sources()
-    wallet_data = all_data.get('Wallet', {})
-    if isinstance(wallet_data, dict):
-        return JsonResponse([wallet_data], safe=False)
-    return JsonResponse(wallet_data, safe=False)
+    wallet_data = marketplace_mock._generate_wallet_data()
+    # Clients expect the single record wrapped in a list
+    return JsonResponse([wallet_data], safe=False)
 
 
 @csrf_exempt
 @require_http_methods(["GET"])
+@cache_control(private=True)
+@cache_page(MARKETING_CACHE_TTL)
 def marketplace_referrals(request):
     """Get referral program info"""
-    all_data = marketplace_mock.get_data_sources()
-    referral_data = all_data.get('Referrals', {})
-    if isinstance(referral_data, dict):
-        return JsonResponse([referral_data], safe=False)
-    return JsonResponse(referral_data, safe=False)
\ No newline at end of file
+    referral_data = marketplace_mock._generate_referral_data()
+    # Clients expect the single record wrapped in a list
+    return JsonResponse([referral_data], safe=False)
\ No newline at end of file
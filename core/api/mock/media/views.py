@@ -16,12 +16,13 @@ from django.views.decorators.http import require_http_methods
 def mock_upload_file(request):
     """Mock file upload endpoint"""
     # In real implementation, would handle request.FILES
+    file_id = uuid.uuid4()
 
     return JsonResponse({
         "success": True,
         "file": {
-            "id": str(uuid.uuid4()),
-            "url": f"https://picsum.photos/400/400?random={uuid.uuid4().hex}",
+            "id": str(file_id),
+            "url": f"https://picsum.photos/400/400?random={file_id.hex}",
             "filename": "uploaded_image.jpg",
             "size": 125000,
             "type": "image/jpeg"
@@ -36,9 +37,10 @@ def mock_upload_multiple(request):
     files = []
 
     for i in range(3):
+        file_id = uuid.uuid4()
         files.append({
-            "id": str(uuid.uuid4()),
-            "url": f"https://picsum.photos/400/400?random={uuid.uuid4().hex}",
+            "id": str(file_id),
+            "url": f"https://picsum.photos/400/400?random={file_id.hex}",
             "filename": f"image_{i + 1}.jpg",
             "size": 125000 + (i * 1000),
             "type": "image/jpeg"
@@ -3,14 +3,119 @@
 Management command to create a comprehensive weather application
 """
 
+from django.conf import settings
 from django.core.management.base import BaseCommand
-from django.db import transaction
+from django.db import connection, transaction
+from django.utils import timezone
 from core.models import (
     Application, Theme, Screen, Widget, WidgetProperty,
     Action, DataSource, DataSourceField
 )
 
 
+# Rows per INSERT when the screen builders bulk-create widgets/properties.
+_BULK_BATCH_SIZE = 50
+
+# WidgetProperty field holding the value for each property_type.
+_VALUE_FIELD = {
+    "string": "string_value",
+    "integer": "integer_value",
+    "decimal": "decimal_value",
+    "boolean": "boolean_value",
+    "color": "color_value",
+    "alignment": "alignment_value",
+    "url": "url_value",
+    "json": "json_value",
+    "action_reference": "action_reference",
+    "data_source_field_reference": "data_source_field_reference",
+    "screen_reference": "screen_reference",
+}
+
+# Column order for the raw WidgetProperty insert used when FAST_BULK is on,
+# and the empty value each column gets when a property doesn't set it.
+_PROPERTY_COLUMNS = (
+    ("string_value", ""),
+    ("integer_value", None),
+    ("decimal_value", None),
+    ("boolean_value", False),
+    ("color_value", None),
+    ("alignment_value", ""),
+    ("url_value", ""),
+    ("json_value", ""),
+    ("action_reference_id", None),
+    ("data_source_field_reference_id", None),
+    ("screen_reference_id", None),
+)
+_PROPERTY_COLUMN_INDEX = {
+    column.removesuffix("_id"): i for i, (column, _) in enumerate(_PROPERTY_COLUMNS)
+}
+_PROPERTY_EMPTY_VALUES = tuple(empty for _, empty in _PROPERTY_COLUMNS)
+
+# Widget IDs for the looped list items, precomputed once at import so the
+# screen builders don't format a new string per item.
+_NAV_IDS = ("nav_home", "nav_map", "nav_location_on", "nav_person")
+_PROFILE_TILE_IDS = (
+    "profile_settings_tile",
+    "profile_card_membership_tile",
+    "profile_lock_tile",
+    "profile_help_tile",
+    "profile_info_tile",
+)
+_SETTING_IDS = ("setting_0", "setting_1", "setting_2", "setting_3", "setting_4")
+_SETTING_SWITCH_IDS = {
+    2: "setting_switch_2",
+    3: "setting_switch_3",
+    4: "setting_switch_4",
+}
+_MAP_TYPES = (
+    ("Radar", "map_btn_radar"),
+    ("Satellite", "map_btn_satellite"),
+    ("Temperature", "map_btn_temperature"),
+    ("Precipitation", "map_btn_precipitation"),
+)
+
+# Declarative widget trees for the simple form screens, consumed by
+# _build_from_specs: (widget_type, parent_widget_id, order, widget_id, properties)
+FORGOT_PASSWORD_SPEC = (
+    ("Column", None, 0, "forgot_column", []),
+    ("Padding", "forgot_column", 0, "forgot_instructions_padding", [
+        ("padding", "integer", 20),
+    ]),
+    ("Text", "forgot_instructions_padding", 0, "forgot_instructions", [
+        ("text", "string", "Enter your email address and we'll send you a link to reset your password."),
+    ]),
+    ("TextField", "forgot_column", 1, "forgot_email", [
+        ("labelText", "string", "Email Address"),
+    ]),
+    ("ElevatedButton", "forgot_column", 2, "forgot_send_btn", [
+        ("text", "string", "Send Reset Link"),
+    ]),
+)
+
+CHANGE_PASSWORD_SPEC = (
+    ("Column", None, 0, "change_password_column", []),
+    ("Padding", "change_password_column", 0, "change_password_padding", [
+        ("padding", "integer", 20),
+    ]),
+    ("Column", "change_password_padding", 0, "change_password_form", []),
+    ("TextField", "change_password_form", 0, "current_password", [
+        ("labelText", "string", "Current Password"),
+        ("obscureText", "boolean", True),
+    ]),
+    ("TextField", "change_password_form", 1, "new_password", [
+        ("labelText", "string", "New Password"),
+        ("obscureText", "boolean", True),
+    ]),
+    ("TextField", "change_password_form", 2, "confirm_password", [
+        ("labelText", "string", "Confirm New Password"),
+        ("obscureText", "boolean", True),
+    ]),
+    ("ElevatedButton", "change_password_form", 3, "change_password_btn", [
+        ("text", "string", "Update Password"),
+    ]),
+)
+
+
 class Command(BaseCommand):
     help = 'Create a comprehensive weather application with all features'
 
@@ -46,6 +151,7 @@ class Command(BaseCommand):
             )
 
 
+@transaction.atomic
 def create_comprehensive_weather_app(custom_name=None, package_name=None):
     """Create a comprehensive weather application with all features"""
 
@@ -100,8 +206,12 @@ def create_comprehensive_weather_app(custom_name=None, package_name=None):
     create_payment_screen_widgets(screens['payment'], data_sources, actions)
     create_register_screen_widgets(screens['register'], data_sources, actions)
     create_login_screen_widgets(screens['login'], data_sources, actions)
-    create_forgot_password_screen_widgets(screens['forgot_password'], data_sources, actions)
-    create_change_password_screen_widgets(screens['change_password'], data_sources, actions)
+
+    # Spec-driven screens are inserted together in one batch
+    _build_from_specs([
+        (screens['forgot_password'], FORGOT_PASSWORD_SPEC),
+        (screens['change_password'], CHANGE_PASSWORD_SPEC),
+    ])
 
     return app
 
@@ -636,6 +746,53 @@ def update_action_targets(actions, screens):
             actions[action_name].save()
 
 
+def _icon(screen, parent, order, widget_id, name, size, color):
+    """Build an unsaved Icon widget with its icon, size and color properties"""
+    icon = Widget(
+        screen_id=screen.pk,
+        widget_type="Icon",
+        parent_widget_id=parent.pk,
+        order=order,
+        widget_id=widget_id
+    )
+
+    return icon, [
+        WidgetProperty(widget=icon, property_name="icon", property_type="string", string_value=name),
+        WidgetProperty(widget=icon, property_name="size", property_type="integer", integer_value=size),
+        WidgetProperty(widget=icon, property_name="color", property_type="color", color_value=color),
+    ]
+
+
+def _text(screen, parent, order, widget_id, text, font_size=None):
+    """Build an unsaved Text widget with its text and optional fontSize properties"""
+    text_widget = Widget(
+        screen_id=screen.pk,
+        widget_type="Text",
+        parent_widget_id=parent.pk,
+        order=order,
+        widget_id=widget_id
+    )
+
+    properties = [
+        WidgetProperty(widget=text_widget, property_name="text", property_type="string", string_value=text)
+    ]
+    if font_size is not None:
+        properties.append(
+            WidgetProperty(widget=text_widget, property_name="fontSize", property_type="integer", integer_value=font_size)
+        )
+
+    return text_widget, properties
+
+
+def _save_built(built):
+    """Save (widget, [properties]) pairs from _icon/_text with one bulk insert per model"""
+    Widget.objects.bulk_create([widget for widget, _ in built], batch_size=_BULK_BATCH_SIZE)
+    WidgetProperty.objects.bulk_create(
+        [prop for _, properties in built for prop in properties],
+        batch_size=_BULK_BATCH_SIZE
+    )
+
+
 def create_splash_screen_widgets(screen, data_sources, actions):
     """Create widgets for splash screen"""
     # Main container
@@ -763,6 +920,7 @@ def create_configuration_screen_widgets(screen, data_sources, actions):
 
 def create_home_screen_widgets(screen, data_sources, actions):
     """Create widgets for home screen with proper weather display"""
+    screen_id = screen.pk
     # Main scroll view
     scroll_view = Widget.objects.create(
         screen=screen,
@@ -981,7 +1139,7 @@ def create_home_screen_widgets(screen, data_sources, actions):
 
     for i, (label, value, icon) in enumerate(weather_details):
         detail_card = Widget.objects.create(
-            screen=screen,
+            screen_id=screen_id,
             widget_type="Card",
             parent_widget=details_grid,
             order=i,
@@ -989,7 +1147,7 @@ def create_home_screen_widgets(screen, data_sources, actions):
         )
 
         detail_column = Widget.objects.create(
-            screen=screen,
+            screen_id=screen_id,
             widget_type="Column",
             parent_widget=detail_card,
             order=0,
@@ -1005,7 +1163,7 @@ def create_home_screen_widgets(screen, data_sources, actions):
 
         # Icon
         detail_icon = Widget.objects.create(
-            screen=screen,
+            screen_id=screen_id,
             widget_type="Icon",
             parent_widget=detail_column,
             order=0,
@@ -1028,7 +1186,7 @@ def create_home_screen_widgets(screen, data_sources, actions):
 
         # Label
         detail_label = Widget.objects.create(
-            screen=screen,
+            screen_id=screen_id,
             widget_type="Text",
             parent_widget=detail_column,
             order=1,
@@ -1051,7 +1209,7 @@ def create_home_screen_widgets(screen, data_sources, actions):
 
         # Value
         detail_value = Widget.objects.create(
-            screen=screen,
+            screen_id=screen_id,
             widget_type="Text",
             parent_widget=detail_column,
             order=2,
@@ -1231,13 +1389,13 @@ def create_home_screen_widgets(screen, data_sources, actions):
         ("person", "Profile", actions["Navigate to Profile"]),
     ]
 
-    for i, (icon_name, label, action) in enumerate(nav_items):
+    for i, ((icon_name, label, action), nav_id) in enumerate(zip(nav_items, _NAV_IDS, strict=True)):
         nav_item = Widget.objects.create(
-            screen=screen,
+            screen_id=screen_id,
             widget_type="BottomNavigationBarItem",
             parent_widget=bottom_nav,
             order=i,
-            widget_id=f"nav_{icon_name}"
+            widget_id=nav_id
         )
 
         WidgetProperty.objects.create(
@@ -1265,6 +1423,7 @@ def create_home_screen_widgets(screen, data_sources, actions):
 
 def create_profile_screen_widgets(screen, data_sources, actions):
     """Create widgets for profile screen"""
+    screen_id = screen.pk
     # Profile screen with user info and preferences
     scroll_view = Widget.objects.create(
         screen=screen,
@@ -1343,13 +1502,13 @@ def create_profile_screen_widgets(screen, data_sources, actions):
         ("info", "About", actions["Navigate to About"]),
     ]
 
-    for i, (icon_name, title, action) in enumerate(settings_items):
+    for i, ((icon_name, title, action), tile_id) in enumerate(zip(settings_items, _PROFILE_TILE_IDS, strict=True)):
         list_tile = Widget.objects.create(
-            screen=screen,
+            screen_id=screen_id,
             widget_type="ListTile",
             parent_widget=column,
             order=i + 1,
-            widget_id=f"profile_{icon_name}_tile"
+            widget_id=tile_id
         )
 
         WidgetProperty.objects.create(
@@ -1381,91 +1540,93 @@ def create_profile_screen_widgets(screen, data_sources, actions):
                 action_reference=action
             )
 
-            # Add divider before login/register section
-            divider = Widget.objects.create(
-                screen=screen,
-                widget_type="Divider",
-                parent_widget=column,
-                order=len(settings_items) + 1,
-                widget_id="profile_divider"
-            )
+    # Add divider before login/register section
+    divider = Widget.objects.create(
+        screen=screen,
+        widget_type="Divider",
+        parent_widget=column,
+        order=len(settings_items) + 1,
+        widget_id="profile_divider"
+    )
 
-            # Add login option
-            login_tile = Widget.objects.create(
-                screen=screen,
-                widget_type="ListTile",
-                parent_widget=column,
-                order=len(settings_items) + 2,
-                widget_id="profile_login_tile"
-            )
+    # Add login option
+    login_tile = Widget.objects.create(
+        screen=screen,
+        widget_type="ListTile",
+        parent_widget=column,
+        order=len(settings_items) + 2,
+        widget_id="profile_login_tile"
+    )
 
-            WidgetProperty.objects.create(
-                widget=login_tile,
-                property_name="leading",
-                property_type="string",
-                string_value="login"
-            )
+    WidgetProperty.objects.create(
+        widget=login_tile,
+        property_name="leading",
+        property_type="string",
+        string_value="login"
+    )
 
-            WidgetProperty.objects.create(
-                widget=login_tile,
-                property_name="title",
-                property_type="string",
-                string_value="Sign In"
-            )
+    WidgetProperty.objects.create(
+        widget=login_tile,
+        property_name="title",
+        property_type="string",
+        string_value="Sign In"
+    )
 
-            WidgetProperty.objects.create(
-                widget=login_tile,
-                property_name="trailing",
-                property_type="string",
-                string_value="arrow_forward_ios"
-            )
+    WidgetProperty.objects.create(
+        widget=login_tile,
+        property_name="trailing",
+        property_type="string",
+        string_value="arrow_forward_ios"
+    )
 
-            WidgetProperty.objects.create(
-                widget=login_tile,
-                property_name="onTap",
-                property_type="action_reference",
-                action_reference=actions["Navigate to Login"]
-            )
+    WidgetProperty.objects.create(
+        widget=login_tile,
+        property_name="onTap",
+        property_type="action_reference",
+        action_reference=actions["Navigate to Login"]
+    )
 
-            # Add register option
-            register_tile = Widget.objects.create(
-                screen=screen,
-                widget_type="ListTile",
-                parent_widget=column,
-                order=len(settings_items) + 3,
-                widget_id="profile_register_tile"
-            )
+    # Add register option
+    register_tile = Widget.objects.create(
+        screen=screen,
+        widget_type="ListTile",
+        parent_widget=column,
+        order=len(settings_items) + 3,
+        widget_id="profile_register_tile"
+    )
 
-            WidgetProperty.objects.create(
-                widget=register_tile,
-                property_name="leading",
-                property_type="string",
-                string_value="person_add"
-            )
+    WidgetProperty.objects.create(
+        widget=register_tile,
+        property_name="leading",
+        property_type="string",
+        string_value="person_add"
+    )
 
-            WidgetProperty.objects.create(
-                widget=register_tile,
-                property_name="title",
-                property_type="string",
-                string_value="Create Account"
-            )
+    WidgetProperty.objects.create(
+        widget=register_tile,
+        property_name="title",
+        property_type="string",
+        string_value="Create Account"
+    )
 
-            WidgetProperty.objects.create(
-                widget=register_tile,
-                property_name="trailing",
-                property_type="string",
-                string_value="arrow_forward_ios"
-            )
+    WidgetProperty.objects.create(
+        widget=register_tile,
+        property_name="trailing",
+        property_type="string",
+        string_value="arrow_forward_ios"
+    )
+
+    WidgetProperty.objects.create(
+        widget=register_tile,
+        property_name="onTap",
+        property_type="action_reference",
+        action_reference=actions["Navigate to Register"]
+    )
 
-            WidgetProperty.objects.create(
-                widget=register_tile,
-                property_name="onTap",
-                property_type="action_reference",
-                action_reference=actions["Navigate to Register"]
-            )
 
 def create_settings_screen_widgets(screen, data_sources, actions):
     """Create widgets for settings screen"""
+    screen_id = screen.pk
     column = Widget.objects.create(
         screen=screen,
         widget_type="Column",
@@ -1482,13 +1643,13 @@ def create_settings_screen_widgets(screen, data_sources, actions):
         ("Dark Mode", "Enable dark theme"),
     ]
 
-    for i, (title, subtitle) in enumerate(settings):
+    for i, ((title, subtitle), setting_id) in enumerate(zip(settings, _SETTING_IDS, strict=True)):
         tile = Widget.objects.create(
-            screen=screen,
+            screen_id=screen_id,
             widget_type="ListTile",
             parent_widget=column,
             order=i,
-            widget_id=f"setting_{i}"
+            widget_id=setting_id
         )
 
         WidgetProperty.objects.create(
@@ -1506,13 +1667,14 @@ def create_settings_screen_widgets(screen, data_sources, actions):
         )
 
         # Add switch for some settings
-        if i in [2, 3, 4]:  # Notifications, Auto Refresh, Dark Mode
+        switch_id = _SETTING_SWITCH_IDS.get(i)
+        if switch_id:  # Notifications, Auto Refresh, Dark Mode
             switch = Widget.objects.create(
-                screen=screen,
+                screen_id=screen_id,
                 widget_type="Switch",
                 parent_widget=tile,
                 order=0,
-                widget_id=f"setting_switch_{i}"
+                widget_id=switch_id
             )
 
             WidgetProperty.objects.create(
@@ -1667,6 +1829,7 @@ def create_location_screen_widgets(screen, data_sources, actions):
 
 def create_weather_maps_screen_widgets(screen, data_sources, actions):
     """Create widgets for weather maps screen"""
+    screen_id = screen.pk
     column = Widget.objects.create(
         screen=screen,
         widget_type="Column",
@@ -1690,21 +1853,20 @@ def create_weather_maps_screen_widgets(screen, data_sources, actions):
         string_value="spaceEvenly"
     )
 
-    map_types = ["Radar", "Satellite", "Temperature", "Precipitation"]
-    for i, map_type in enumerate(map_types):
+    for i, (label, btn_id) in enumerate(_MAP_TYPES):
         btn = Widget.objects.create(
-            screen=screen,
+            screen_id=screen_id,
             widget_type="ElevatedButton",
             parent_widget=selector_row,
             order=i,
-            widget_id=f"map_btn_{map_type.lower()}"
+            widget_id=btn_id
         )
 
         WidgetProperty.objects.create(
             widget=btn,
             property_name="text",
             property_type="string",
-            string_value=map_type
+            string_value=label
         )
 
     # Map container (placeholder)
@@ -1788,34 +1950,7 @@ def create_about_screen_widgets(screen, data_sources, actions):
         widget_id="about_logo_center"
     )
 
-    logo = Widget.objects.create(
-        screen=screen,
-        widget_type="Icon",
-        parent_widget=logo_container,
-        order=0,
-        widget_id="about_logo"
-    )
-
-    WidgetProperty.objects.create(
-        widget=logo,
-        property_name="icon",
-        property_type="string",
-        string_value="cloud"
-    )
-
-    WidgetProperty.objects.create(
-        widget=logo,
-        property_name="size",
-        property_type="integer",
-        integer_value=80
-    )
-
-    WidgetProperty.objects.create(
-        widget=logo,
-        property_name="color",
-        property_type="color",
-        color_value="#1976D2"
-    )
+    built = [_icon(screen, logo_container, 0, "about_logo", "cloud", 80, "#1976D2")]
 
     # App name
     name_text = Widget.objects.create(
@@ -1826,27 +1961,7 @@ def create_about_screen_widgets(screen, data_sources, actions):
         widget_id="about_name_center"
     )
 
-    name = Widget.objects.create(
-        screen=screen,
-        widget_type="Text",
-        parent_widget=name_text,
-        order=0,
-        widget_id="about_name"
-    )
-
-    WidgetProperty.objects.create(
-        widget=name,
-        property_name="text",
-        property_type="string",
-        string_value="WeatherPro"
-    )
-
-    WidgetProperty.objects.create(
-        widget=name,
-        property_name="fontSize",
-        property_type="integer",
-        integer_value=24
-    )
+    built.append(_text(screen, name_text, 0, "about_name", "WeatherPro", font_size=24))
 
     # Version
     version_text = Widget.objects.create(
@@ -1857,20 +1972,7 @@ def create_about_screen_widgets(screen, data_sources, actions):
         widget_id="about_version_center"
     )
 
-    version = Widget.objects.create(
-        screen=screen,
-        widget_type="Text",
-        parent_widget=version_text,
-        order=0,
-        widget_id="about_version"
-    )
-
-    WidgetProperty.objects.create(
-        widget=version,
-        property_name="text",
-        property_type="string",
-        string_value="Version 1.0.0"
-    )
+    built.append(_text(screen, version_text, 0, "about_version", "Version 1.0.0"))
 
     # Description
     desc_padding = Widget.objects.create(
@@ -1888,20 +1990,12 @@ def create_about_screen_widgets(screen, data_sources, actions):
         integer_value=20
     )
 
-    description = Widget.objects.create(
-        screen=screen,
-        widget_type="Text",
-        parent_widget=desc_padding,
-        order=0,
-        widget_id="about_description"
-    )
+    built.append(_text(
+        screen, desc_padding, 0, "about_description",
+        "WeatherPro provides accurate weather forecasts, interactive maps, and real-time alerts to keep you informed about weather conditions worldwide."
+    ))
 
-    WidgetProperty.objects.create(
-        widget=description,
-        property_name="text",
-        property_type="string",
-        string_value="WeatherPro provides accurate weather forecasts, interactive maps, and real-time alerts to keep you informed about weather conditions worldwide."
-    )
+    _save_built(built)
 
 
 def create_support_screen_widgets(screen, data_sources, actions):
@@ -2320,34 +2414,7 @@ def create_login_screen_widgets(screen, data_sources, actions):
         widget_id="login_logo_center"
     )
 
-    logo = Widget.objects.create(
-        screen=screen,
-        widget_type="Icon",
-        parent_widget=logo_center,
-        order=0,
-        widget_id="login_logo"
-    )
-
-    WidgetProperty.objects.create(
-        widget=logo,
-        property_name="icon",
-        property_type="string",
-        string_value="cloud"
-    )
-
-    WidgetProperty.objects.create(
-        widget=logo,
-        property_name="size",
-        property_type="integer",
-        integer_value=80
-    )
-
-    WidgetProperty.objects.create(
-        widget=logo,
-        property_name="color",
-        property_type="color",
-        color_value="#1976D2"
-    )
+    _save_built([_icon(screen, logo_center, 0, "login_logo", "cloud", 80, "#1976D2")])
 
     # Form
     form_padding = Widget.objects.create(
@@ -2482,192 +2549,82 @@ def create_login_screen_widgets(screen, data_sources, actions):
     )
 
 
-def create_forgot_password_screen_widgets(screen, data_sources, actions):
-    """Create widgets for forgot password screen"""
-    column = Widget.objects.create(
-        screen=screen,
-        widget_type="Column",
-        order=0,
-        widget_id="forgot_column"
-    )
-
-    # Instructions
-    instructions_padding = Widget.objects.create(
-        screen=screen,
-        widget_type="Padding",
-        parent_widget=column,
-        order=0,
-        widget_id="forgot_instructions_padding"
-    )
-
-    WidgetProperty.objects.create(
-        widget=instructions_padding,
-        property_name="padding",
-        property_type="integer",
-        integer_value=20
-    )
-
-    instructions = Widget.objects.create(
-        screen=screen,
-        widget_type="Text",
-        parent_widget=instructions_padding,
-        order=0,
-        widget_id="forgot_instructions"
-    )
-
-    WidgetProperty.objects.create(
-        widget=instructions,
-        property_name="text",
-        property_type="string",
-        string_value="Enter your email address and we'll send you a link to reset your password."
-    )
-
-    # Email field
-    email_field = Widget.objects.create(
-        screen=screen,
-        widget_type="TextField",
-        parent_widget=column,
-        order=1,
-        widget_id="forgot_email"
-    )
-
-    WidgetProperty.objects.create(
-        widget=email_field,
-        property_name="labelText",
-        property_type="string",
-        string_value="Email Address"
-    )
-
-    # Send button
-    send_btn = Widget.objects.create(
-        screen=screen,
-        widget_type="ElevatedButton",
-        parent_widget=column,
-        order=2,
-        widget_id="forgot_send_btn"
-    )
-
-    WidgetProperty.objects.create(
-        widget=send_btn,
-        property_name="text",
-        property_type="string",
-        string_value="Send Reset Link"
-    )
-
-
-def create_change_password_screen_widgets(screen, data_sources, actions):
-    """Create widgets for change password screen"""
-    column = Widget.objects.create(
-        screen=screen,
-        widget_type="Column",
-        order=0,
-        widget_id="change_password_column"
-    )
-
-    form_padding = Widget.objects.create(
-        screen=screen,
-        widget_type="Padding",
-        parent_widget=column,
-        order=0,
-        widget_id="change_password_padding"
-    )
-
-    WidgetProperty.objects.create(
-        widget=form_padding,
-        property_name="padding",
-        property_type="integer",
-        integer_value=20
-    )
-
-    form_column = Widget.objects.create(
-        screen=screen,
-        widget_type="Column",
-        parent_widget=form_padding,
-        order=0,
-        widget_id="change_password_form"
-    )
-
-    # Current password field
-    current_field = Widget.objects.create(
-        screen=screen,
-        widget_type="TextField",
-        parent_widget=form_column,
-        order=0,
-        widget_id="current_password"
-    )
-
-    WidgetProperty.objects.create(
-        widget=current_field,
-        property_name="labelText",
-        property_type="string",
-        string_value="Current Password"
-    )
-
-    WidgetProperty.objects.create(
-        widget=current_field,
-        property_name="obscureText",
-        property_type="boolean",
-        boolean_value=True
-    )
-
-    # New password field
-    new_field = Widget.objects.create(
-        screen=screen,
-        widget_type="TextField",
-        parent_widget=form_column,
-        order=1,
-        widget_id="new_password"
-    )
-
-    WidgetProperty.objects.create(
-        widget=new_field,
-        property_name="labelText",
-        property_type="string",
-        string_value="New Password"
-    )
-
-    WidgetProperty.objects.create(
-        widget=new_field,
-        property_name="obscureText",
-        property_type="boolean",
-        boolean_value=True
-    )
-
-    # Confirm password field
-    confirm_field = Widget.objects.create(
-        screen=screen,
-        widget_type="TextField",
-        parent_widget=form_column,
-        order=2,
-        widget_id="confirm_password"
-    )
-
-    WidgetProperty.objects.create(
-        widget=confirm_field,
-        property_name="labelText",
-        property_type="string",
-        string_value="Confirm New Password"
-    )
-
-    WidgetProperty.objects.create(
-        widget=confirm_field,
-        property_name="obscureText",
-        property_type="boolean",
-        boolean_value=True
-    )
-
-    # Change button
-    change_btn = Widget.objects.create(
-        screen=screen,
-        widget_type="ElevatedButton",
-        parent_widget=form_column,
-        order=3,
-        widget_id="change_password_btn"
-    )
-
-    WidgetProperty.objects.create(
-        widget=change_btn,
-        property_name="text",
-        property_type="string",
-        string_value="Update Password"
-    )
\ No newline at end of file
+def _build_from_specs(screen_specs):
+    """Create the widget trees and properties described by screen specs.
+
+    ``screen_specs`` is a list of ``(screen, spec)`` pairs. Each spec entry
+    is ``(widget_type, parent_widget_id, order, widget_id,
+    [(property_name, property_type, value), ...])`` with parents listed
+    before their children. Widgets of all screens are inserted one tree
+    depth at a time, so the whole batch costs one INSERT per level plus
+    one for all properties.
+    """
+    widgets = {}
+    parents = {}
+    by_depth = {}
+    depths = {}
+    for screen, spec in screen_specs:
+        screen_id = screen.pk
+        for widget_type, parent_key, order, widget_id, _ in spec:
+            key = (screen_id, widget_id)
+            widgets[key] = Widget(
+                screen_id=screen_id,
+                widget_type=widget_type,
+                order=order,
+                widget_id=widget_id
+            )
+            if parent_key is None:
+                depths[key] = 0
+            else:
+                parents[key] = (screen_id, parent_key)
+                depths[key] = depths[parents[key]] + 1
+            by_depth.setdefault(depths[key], []).append(key)
+
+    for depth in sorted(by_depth):
+        level = by_depth[depth]
+        if depth:
+            for key in level:
+                widgets[key].parent_widget_id = widgets[parents[key]].pk
+        Widget.objects.bulk_create([widgets[key] for key in level], batch_size=_BULK_BATCH_SIZE)
+
+    flat_properties = [
+        (widgets[(screen.pk, widget_id)].pk, property_name, property_type, value)
+        for screen, spec in screen_specs
+        for _, _, _, widget_id, properties in spec
+        for property_name, property_type, value in properties
+    ]
+    if settings.FAST_BULK:
+        _insert_properties_raw(flat_properties)
+    else:
+        WidgetProperty.objects.bulk_create([
+            WidgetProperty(
+                widget_id=widget_pk,
+                property_name=property_name,
+                property_type=property_type,
+                **{_VALUE_FIELD[property_type]: value}
+            )
+            for widget_pk, property_name, property_type, value in flat_properties
+        ], batch_size=_BULK_BATCH_SIZE)
+
+    return widgets
+
+
+def _insert_properties_raw(flat_properties):
+    """Insert (widget_pk, name, type, value) rows with one executemany call"""
+    created_at = connection.ops.adapt_datetimefield_value(timezone.now())
+    rows = []
+    for widget_pk, property_name, property_type, value in flat_properties:
+        values = list(_PROPERTY_EMPTY_VALUES)
+        values[_PROPERTY_COLUMN_INDEX[_VALUE_FIELD[property_type]]] = getattr(value, "pk", value)
+        rows.append((widget_pk, property_name, property_type, *values, created_at))
+
+    columns = ["widget_id", "property_name", "property_type"]
+    columns += [column for column, _ in _PROPERTY_COLUMNS]
+    columns.append("created_at")
+    sql = "INSERT INTO {} ({}) VALUES ({})".format(
+        connection.ops.quote_name(WidgetProperty._meta.db_table),
+        ", ".join(connection.ops.quote_name(column) for column in columns),
+        ", ".join(["%s"] * len(columns)),
+    )
+    with connection.cursor() as cursor:
+        cursor.executemany(sql, rows)
@@ -1,28 +1,509 @@
+import io
+from types import MappingProxyType
+
+from django.conf import settings
 from django.core.management.base import BaseCommand
-from django.db import transaction
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
 from core.models import (
     Application, Theme, Screen, Widget, WidgetProperty, Action
 )
 
 
+# Showcase screens in Home order: (label, builder method name)
+_SCREEN_BUILDERS = (
+    ('Container', '_build_spec_screen'),
+    ('Column', '_build_column_screen'),
+    ('Row', '_build_row_screen'),
+    ('Stack', '_build_spec_screen'),
+    ('Center', '_build_spec_screen'),
+    ('Padding', '_build_spec_screen'),
+    ('SizedBox', '_build_spec_screen'),
+    ('Expanded & Flexible', '_build_spec_screen'),
+    ('Align', '_build_spec_screen'),
+    ('Positioned', '_build_spec_screen'),
+    ('SingleChildScrollView', '_build_scrollview_screen'),
+    ('PageView', '_build_pageview_screen'),
+    ('SafeArea', '_build_spec_screen'),
+    ('Future/Stream', '_build_spec_screen'),
+    ('Text', '_build_spec_screen'),
+    ('Image', '_build_spec_screen'),
+    ('Icon', '_build_spec_screen'),
+    ('TextField', '_build_spec_screen'),
+    ('TextButton', '_build_spec_screen'),
+    ('OutlinedButton', '_build_spec_screen'),
+    ('IconButton', '_build_spec_screen'),
+    ('FloatingActionButton', '_build_spec_screen'),
+    ('Switch', '_build_spec_screen'),
+    ('Checkbox', '_build_spec_screen'),
+    ('Radio', '_build_spec_screen'),
+    ('Slider', '_build_spec_screen'),
+    ('DropdownButton', '_build_spec_screen'),
+    ('Tooltip', '_build_spec_screen'),
+    ('Divider', '_build_spec_screen'),
+    ('Card', '_build_spec_screen'),
+    ('ListTile', '_build_spec_screen'),
+    ('ListView', '_build_listview_screen'),
+    ('GridView', '_build_spec_screen'),
+    ('BottomNavigationBar', '_build_bottomnav_screen'),
+    ('TabBar', '_build_tabs_screen'),
+    ('Drawer', '_build_drawer_screen'),
+    ('Scaffold', '_build_spec_screen'),
+    ('AspectRatio & Wrap', '_build_aspect_wrap_screen'),
+    ('SnackBar', '_build_snackbar_screen'),
+    ('Dialog/AlertDialog', '_build_dialog_screen'),
+)
+
+# (label, builder method name, route, widget id slug), with slugs computed once at import
+_SCREENS = tuple(
+    (
+        label,
+        builder_name,
+        f"/{label.lower().replace(' ', '-').replace('&', 'and')}",
+        label.lower().replace(' ', '_'),
+    )
+    for label, builder_name in _SCREEN_BUILDERS
+)
+
+# WidgetProperty field that holds the value for each property_type (read-only)
+_TYPE_FIELD = MappingProxyType({
+    'string': 'string_value',
+    'integer': 'integer_value',
+    'decimal': 'decimal_value',
+    'boolean': 'boolean_value',
+    'color': 'color_value',
+    'alignment': 'alignment_value',
+    'url': 'url_value',
+    'json': 'json_value',
+    'action_reference': 'action_reference',
+    'data_source_field_reference': 'data_source_field_reference',
+    'screen_reference': 'screen_reference',
+})
+
+
+# Property tables for the showcase widgets that set many properties: (name, type, value)
+_CONTAINER_PROPS = (
+    # Size, spacing
+    ('width', 'integer', 320),
+    ('height', 'integer', 160),
+    ('padding', 'integer', 16),
+    ('margin', 'integer', 12),
+    # Decoration and alignment
+    ('color', 'color', '#F5F5F5'),
+    ('alignment', 'alignment', 'center'),
+    ('borderRadius', 'integer', 12),
+    ('borderColor', 'color', '#1976D2'),
+    ('borderWidth', 'integer', 2),
+    ('boxShadowColor', 'color', '#55000000'),
+    ('boxShadowBlur', 'integer', 8),
+    ('boxShadowSpread', 'integer', 1),
+    ('boxShadowOffsetX', 'integer', 0),
+    ('boxShadowOffsetY', 'integer', 2),
+    ('gradientStart', 'color', '#1976D2'),
+    ('gradientEnd', 'color', '#E91E63'),
+    # Constraints
+    ('minWidth', 'integer', 200),
+    ('maxWidth', 'integer', 360),
+    ('minHeight', 'integer', 120),
+    ('maxHeight', 'integer', 180),
+)
+
+_TEXT_PROPS = (
+    ('text', 'string', 'Styled Text Example'),
+    ('fontSize', 'integer', 20),
+    ('fontWeight', 'string', 'bold'),
+    ('fontStyle', 'string', 'italic'),
+    ('color', 'color', '#1976D2'),
+    ('fontFamily', 'string', 'Roboto'),
+    ('letterSpacing', 'decimal', 1.2),
+    ('wordSpacing', 'decimal', 2.0),
+    ('height', 'decimal', 1.3),
+    ('decoration', 'string', 'underline'),
+    ('decorationColor', 'color', '#E91E63'),
+    ('decorationStyle', 'string', 'dashed'),
+    ('decorationThickness', 'decimal', 2.0),
+    ('textAlign', 'string', 'center'),
+    ('softWrap', 'boolean', True),
+    ('overflow', 'string', 'ellipsis'),
+    ('maxLines', 'integer', 2),
+)
+
+_IMAGE_PROPS = (
+    ('imageUrl', 'url', 'https://picsum.photos/400/200'),
+    ('width', 'integer', 300),
+    ('height', 'integer', 150),
+    ('fit', 'string', 'cover'),
+    ('alignment', 'alignment', 'center'),
+    ('repeat', 'string', 'noRepeat'),
+    ('opacity', 'decimal', 0.95),
+    ('colorBlendMode', 'string', 'srcOver'),
+    ('scale', 'decimal', 1.0),
+)
+
+_TEXTFIELD_PROPS = (
+    ('labelText', 'string', 'Email'),
+    ('hintText', 'string', 'enter your email'),
+    ('obscureText', 'boolean', False),
+    # Extras (editor shows but backend may ignore gracefully)
+    ('prefixIcon', 'string', 'email'),
+    ('filled', 'boolean', True),
+    ('fillColor', 'color', '#FFFDE7'),
+    ('borderRadius', 'integer', 8),
+    ('helperText', 'string', 'We will not share your email.'),
+)
+
+# Screens made of fixed widgets, built by _build_spec_screen. Each entry is
+# (widget_type, parent widget_id, order, widget_id, properties) in creation order
+SCREEN_SPECS = {
+    'Container': (
+        ('Container', None, 0, 'container_demo', _CONTAINER_PROPS),
+        ('Text', 'container_demo', 0, 'container_text', (
+            ('text', 'string', 'Container with decoration, constraints, padding, margin'),
+            ('fontSize', 'integer', 14),
+        )),
+    ),
+    'Stack': (
+        ('Stack', None, 0, 'stack_demo', ()),
+        ('Container', 'stack_demo', 0, 'stack_base', (
+            ('width', 'integer', 300),
+            ('height', 'integer', 160),
+            ('color', 'color', '#BBDEFB'),
+        )),
+        ('Positioned', 'stack_demo', 1, 'stack_pos', (
+            ('top', 'integer', 16),
+            ('left', 'integer', 16),
+            ('width', 'integer', 120),
+            ('height', 'integer', 80),
+        )),
+        ('Container', 'stack_pos', 0, 'stack_inner', (('color', 'color', '#1976D2'),)),
+    ),
+    'Center': (
+        ('Center', None, 0, 'center_demo', (
+            ('widthFactor', 'decimal', 1.2),
+            ('heightFactor', 'decimal', 1.2),
+        )),
+        ('Text', 'center_demo', 0, 'center_text', (('text', 'string', 'Centered content with factors'),)),
+    ),
+    'Padding': (
+        ('Padding', None, 0, 'padding_demo', (('padding', 'integer', 24),)),
+        ('Text', 'padding_demo', 0, 'padding_text', (('text', 'string', 'Padding applied'),)),
+    ),
+    'SizedBox': (
+        ('SizedBox', None, 0, 'sized_demo', (
+            ('width', 'integer', 220),
+            ('height', 'integer', 60),
+        )),
+    ),
+    'Expanded & Flexible': (
+        ('Row', None, 0, 'expand_row', ()),
+        ('Expanded', 'expand_row', 0, 'expanded_demo', (('flex', 'integer', 2),)),
+        ('Text', 'expanded_demo', 0, 'expanded_text', ()),
+        ('Flexible', 'expand_row', 1, 'flexible_demo', (
+            ('flex', 'integer', 1),
+            ('fit', 'string', 'tight'),
+        )),
+        ('Text', 'flexible_demo', 0, 'flexible_text', ()),
+    ),
+    'Align': (
+        ('Align', None, 0, 'align_demo', (('alignment', 'alignment', 'bottomRight'),)),
+        ('Text', 'align_demo', 0, 'align_text', ()),
+    ),
+    'Positioned': (
+        # Positioned only needs a Stack parent; the full Stack demo lives on its own screen
+        ('Stack', None, 0, 'positioned_stack', ()),
+        ('Positioned', 'positioned_stack', 0, 'positioned_demo', (
+            ('top', 'integer', 16),
+            ('left', 'integer', 16),
+            ('width', 'integer', 120),
+            ('height', 'integer', 80),
+        )),
+        ('Container', 'positioned_demo', 0, 'positioned_inner', (('color', 'color', '#1976D2'),)),
+    ),
+    'SafeArea': (
+        ('SafeArea', None, 0, 'safearea_demo', ()),
+        ('Text', 'safearea_demo', 0, 'sa_text', (('text', 'string', 'Safe area content'),)),
+    ),
+    'Future/Stream': (
+        ('FutureBuilder', None, 0, 'fb_placeholder', ()),
+        ('StreamBuilder', None, 1, 'sb_placeholder', ()),
+    ),
+    'Text': (
+        ('Text', None, 0, 'text_demo', _TEXT_PROPS),
+    ),
+    'Image': (
+        ('Image', None, 0, 'image_demo', _IMAGE_PROPS),
+    ),
+    'Icon': (
+        ('Icon', None, 0, 'icon_demo', (
+            ('icon', 'string', 'home'),
+            ('size', 'integer', 48),
+            ('color', 'color', '#FF5722'),
+        )),
+    ),
+    'TextField': (
+        ('TextField', None, 0, 'textfield_demo', _TEXTFIELD_PROPS),
+    ),
+    'TextButton': (
+        ('TextButton', None, 0, 'textbutton_demo', (
+            ('text', 'string', 'TextButton'),
+            ('foregroundColor', 'color', '#1976D2'),
+            ('padding', 'integer', 12),
+        )),
+    ),
+    'OutlinedButton': (
+        ('OutlinedButton', None, 0, 'outlinedbutton_demo', (
+            ('text', 'string', 'OutlinedButton'),
+            ('borderColor', 'color', '#1976D2'),
+            ('borderWidth', 'integer', 2),
+            ('borderRadius', 'integer', 8),
+        )),
+    ),
+    'IconButton': (
+        ('IconButton', None, 0, 'iconbutton_demo', (
+            ('icon', 'string', 'favorite'),
+            ('color', 'color', '#E91E63'),
+            ('size', 'integer', 28),
+            ('splashRadius', 'integer', 22),
+        )),
+    ),
+    'FloatingActionButton': (
+        ('FloatingActionButton', None, 0, 'fab_demo', (
+            ('icon', 'string', 'add'),
+            ('backgroundColor', 'color', '#1976D2'),
+            ('foregroundColor', 'color', '#FFFFFF'),
+            # Use either mini or extended, not both (extended doesn't support mini)
+            ('extended', 'boolean', True),
+            ('label', 'string', 'Create'),
+        )),
+    ),
+    'Switch': (
+        ('Switch', None, 0, 'switch_demo', (('value', 'boolean', True),)),
+    ),
+    'Checkbox': (
+        ('Checkbox', None, 0, 'checkbox_demo', (('value', 'boolean', True),)),
+    ),
+    'Radio': (
+        ('Radio', None, 0, 'radio_demo', (
+            ('value', 'string', 'A'),
+            ('groupValue', 'string', 'A'),
+        )),
+    ),
+    'Slider': (
+        ('Slider', None, 0, 'slider_demo', (
+            ('value', 'decimal', 0.5),
+            ('min', 'decimal', 0.0),
+            ('max', 'decimal', 1.0),
+        )),
+    ),
+    'DropdownButton': (
+        ('DropdownButton', None, 0, 'dropdown_demo', (
+            ('items', 'string', 'Red,Green,Blue'),
+            ('value', 'string', 'Green'),
+        )),
+    ),
+    'Divider': (
+        ('Divider', None, 0, 'divider_demo', (
+            ('height', 'integer', 24),
+            ('thickness', 'integer', 2),
+            ('indent', 'integer', 16),
+            ('endIndent', 'integer', 16),
+            ('color', 'color', '#9E9E9E'),
+        )),
+        ('Text', None, 1, 'divider_note', (('text', 'string', 'Divider above has height, thickness, indent, endIndent and color'),)),
+    ),
+    'Card': (
+        ('Card', None, 0, 'card_demo', (
+            ('elevation', 'integer', 6),
+            ('margin', 'integer', 12),
+            ('color', 'color', '#FFF3E0'),
+            ('shadowColor', 'color', '#FF9800'),
+            ('borderRadius', 'integer', 12),
+            ('padding', 'integer', 16),
+        )),
+        ('Text', 'card_demo', 0, 'card_text', (('text', 'string', 'Card with color, elevation, borderRadius and padding'),)),
+    ),
+    'ListTile': (
+        ('ListTile', None, 0, 'listtile_demo', (
+            ('title', 'string', 'ListTile Title'),
+            ('subtitle', 'string', 'Subtitle text'),
+            ('leading', 'string', 'star'),
+            ('trailing', 'string', 'chevron_right'),
+            ('tileColor', 'color', '#E0F7FA'),
+            ('contentPadding', 'integer', 12),
+        )),
+    ),
+    'GridView': (
+        ('GridView', None, 0, 'gridview_demo', (
+            ('crossAxisCount', 'integer', 3),
+            ('childAspectRatio', 'decimal', 1.0),
+            ('padding', 'integer', 8),
+        )),
+    ),
+    'Tooltip': (
+        ('Tooltip', None, 0, 'tooltip_demo', (
+            ('message', 'string', 'Tooltip message'),
+            ('padding', 'integer', 8),
+            ('margin', 'integer', 8),
+        )),
+        ('ElevatedButton', 'tooltip_demo', 0, 'tooltip_btn', (('text', 'string', 'Hover me'),)),
+    ),
+    'Scaffold': (
+        ('Scaffold', None, 0, 'scaffold_demo', (('backgroundColor', 'color', '#FAFAFA'),)),
+        ('Text', 'scaffold_demo', 0, 'sc_body_text', (('text', 'string', 'Scaffold body content'),)),
+    ),
+}
+
+
+# Page/tab background colors shared by the PageView and TabBarView demos
+TAB_COLORS = ('#FFCDD2', '#C8E6C9', '#BBDEFB')
+
+# BottomNavigationBar demo items: (icon, label)
+BNAV_ITEMS = (('home', 'Home'), ('search', 'Search'), ('person', 'Profile'))
+
+
+def _numbered(id_prefix, label, count):
+    return tuple((f'{id_prefix}{i}', f'{label} {i + 1}') for i in range(count))
+
+
+# Widget ids and texts for the repeated children of the looping demos
+_COL_BUTTONS = _numbered('col_btn_', 'Button', 3)
+_ROW_ITEMS = _numbered('row_text_', 'Item', 3)
+_SCSV_ITEMS = _numbered('scsv_t_', 'Item', 10)
+_LV_ITEMS = _numbered('lv_t_', 'List item', 5)
+_TAB_ITEMS = _numbered('tab_', 'Tab', 3)
+_DRAWER_ITEMS = _numbered('dr_lt_', 'Item', 3)
+_WRAP_CHIPS = _numbered('wrap_btn_', 'Chip', 6)
+_BNAV_IDS = tuple(f'bn_item_{i}' for i in range(len(BNAV_ITEMS)))
+# (container id, text id, text) per page/tab
+_PAGE_IDS = tuple((f'pv_{i}', f'pv_t_{i}', f'Page {i + 1}') for i in range(len(TAB_COLORS)))
+_TAB_VIEW_IDS = tuple((f'tbv_c_{i}', f'tbv_t_{i}', f'Content of Tab {i + 1}') for i in range(len(TAB_COLORS)))
+
+
+def _copy_text(value):
+    """Encode a value for COPY's text format"""
+    if value is None:
+        return '\\N'
+    return (
+        str(value)
+        .replace('\\', '\\\\')
+        .replace('\t', '\\t')
+        .replace('\n', '\\n')
+        .replace('\r', '\\r')
+    )
+
+
+class WidgetCollector:
+    """Collects unsaved widgets, actions and properties and inserts them in bulk.
+
+    Widgets are inserted one tree depth at a time so that children can
+    point at parent rows that already have primary keys, then actions,
+    then all properties in a single batch. Builders therefore never touch
+    the database themselves.
+    """
+
+    def __init__(self, using=DEFAULT_DB_ALIAS):
+        self.using = using
+        self.widgets = []
+        self.actions = []
+        self.properties = []
+        self._depths = {}
+
+    def add_widget(self, **kwargs) -> Widget:
+        widget = Widget(**kwargs)
+        parent = kwargs.get('parent_widget')
+        self._depths[id(widget)] = 0 if parent is None else self._depths[id(parent)] + 1
+        self.widgets.append(widget)
+        return widget
+
+    def add_action(self, **kwargs) -> Action:
+        action = Action(**kwargs)
+        self.actions.append(action)
+        return action
+
+    def add_property(self, widget: Widget, name: str, property_type: str, value) -> WidgetProperty:
+        prop = WidgetProperty(
+            widget=widget,
+            property_name=name,
+            property_type=property_type,
+            **{_TYPE_FIELD[property_type]: value}
+        )
+        self.properties.append(prop)
+        return prop
+
+    def add_properties(self, widget: Widget, props):
+        add_property = self.add_property
+        for name, property_type, value in props:
+            add_property(widget, name, property_type, value)
+
+    def flush(self):
+        using = self.using
+        levels = {}
+        for widget in self.widgets:
+            levels.setdefault(self._depths[id(widget)], []).append(widget)
+        for depth in sorted(levels):
+            Widget.objects.using(using).bulk_create(levels[depth], batch_size=settings.WIDGETS_APP_BATCH_SIZE)
+        if self.actions:
+            Action.objects.using(using).bulk_create(self.actions, batch_size=settings.WIDGETS_APP_BATCH_SIZE)
+        if connections[using].vendor == 'postgresql':
+            self._copy_properties()
+        else:
+            WidgetProperty.objects.using(using).bulk_create(self.properties, batch_size=settings.WIDGETS_APP_BATCH_SIZE)
+        self.widgets = []
+        self.actions = []
+        self.properties = []
+        self._depths = {}
+
+    def _copy_properties(self):
+        """Load the properties with PostgreSQL COPY instead of INSERT statements"""
+        from django.db.backends.postgresql.psycopg_any import is_psycopg3
+
+        connection = connections[self.using]
+        fields = [f for f in WidgetProperty._meta.concrete_fields if not f.primary_key]
+        relations = [f for f in fields if f.many_to_one]
+        rows = []
+        for prop in self.properties:
+            # Pick up the keys of widgets/actions that were saved after being assigned
+            for f in relations:
+                if f.is_cached(prop):
+                    setattr(prop, f.attname, getattr(prop, f.name).pk)
+            rows.append([f.get_db_prep_save(f.pre_save(prop, True), connection) for f in fields])
+
+        qn = connection.ops.quote_name
+        sql = 'COPY {} ({}) FROM STDIN'.format(
+            qn(WidgetProperty._meta.db_table),
+            ', '.join(qn(f.column) for f in fields),
+        )
+        with connection.cursor() as cursor:
+            if is_psycopg3:
+                with cursor.copy(sql) as copy:
+                    for row in rows:
+                        copy.write_row(row)
+            else:
+                buf = io.StringIO()
+                for row in rows:
+                    buf.write('\t'.join(_copy_text(value) for value in row) + '\n')
+                buf.seek(0)
+                cursor.copy_expert(sql, buf)
+
+
 class Command(BaseCommand):
     help = 'Create a Widgets App that showcases all supported widgets and properties'
 
     def add_arguments(self, parser):
         parser.add_argument('--name', type=str, default='Widgets App', help='Application name')
         parser.add_argument('--package', type=str, default='com.example.widgets_app', help='Package name')
+        parser.add_argument('--database', default=DEFAULT_DB_ALIAS, help='Database alias to create the app in')
 
     def handle(self, *args, **options):
         app_name = options['name']
         package_name = options['package']
+        using = options['database']
 
         try:
-            with transaction.atomic():
-                app = self._create_app(app_name, package_name)
-                actions_map = {}
+            with transaction.atomic(using=using):
+                app = self._create_app(app_name, package_name, using)
 
-                # Create Home screen
-                home = Screen.objects.create(
+                # Create Home and all showcase screens in one insert
+                home = Screen(
                     application=app,
                     name='Home',
                     route_name='/',
@@ -31,56 +512,8 @@ class Command(BaseCommand):
                     show_app_bar=True,
                     show_back_button=False
                 )
-
-                # Screens map (label -> builder function)
-                screens = {
-                    'Container': self._build_container_screen,
-                    'Column': self._build_column_screen,
-                    'Row': self._build_row_screen,
-                    'Stack': self._build_stack_screen,
-                    'Center': self._build_center_screen,
-                    'Padding': self._build_padding_screen,
-                    'SizedBox': self._build_sizedbox_screen,
-                    'Expanded & Flexible': self._build_expand_flexible_screen,
-                    'Align': self._build_align_screen,
-                    'Positioned': self._build_positioned_screen,
-                    'SingleChildScrollView': self._build_scrollview_screen,
-                    'PageView': self._build_pageview_screen,
-                    'SafeArea': self._build_safearea_screen,
-                    'Future/Stream': self._build_future_stream_screen,
-                    'Text': self._build_text_screen,
-                    'Image': self._build_image_screen,
-                    'Icon': self._build_icon_screen,
-                    'TextField': self._build_textfield_screen,
-                    'TextButton': self._build_textbutton_screen,
-                    'OutlinedButton': self._build_outlinedbutton_screen,
-                    'IconButton': self._build_iconbutton_screen,
-                    'FloatingActionButton': self._build_fab_only_screen,
-                    'Switch': self._build_switch_screen,
-                    'Checkbox': self._build_checkbox_screen,
-                    'Radio': self._build_radio_screen,
-                    'Slider': self._build_slider_screen,
-                    'DropdownButton': self._build_dropdown_screen,
-                    'Tooltip': self._build_tooltip_screen,
-                    'Divider': self._build_divider_screen,
-                    'Card': self._build_card_screen,
-                    'ListTile': self._build_listtile_screen,
-                    'ListView': self._build_listview_screen,
-                    'GridView': self._build_gridview_screen,
-                    'BottomNavigationBar': self._build_bottomnav_screen,
-                    'TabBar': self._build_tabs_screen,
-                    'Drawer': self._build_drawer_screen,
-                    'Scaffold': self._build_scaffold_screen,
-                    'AspectRatio & Wrap': self._build_aspect_wrap_screen,
-                    'SnackBar': self._build_snackbar_screen,
-                    'Dialog/AlertDialog': self._build_dialog_screen,
-                }
-
-                # Create screens and actions
-                screen_refs = {}
-                for idx, (label, builder) in enumerate(screens.items()):
-                    route = f"/{label.lower().replace(' ', '-').replace('&', 'and')}"
-                    screen = Screen.objects.create(
+                screen_objs = [
+                    Screen(
                         application=app,
                         name=label,
                         route_name=route,
@@ -89,50 +522,66 @@ class Command(BaseCommand):
                         show_app_bar=True,
                         show_back_button=True
                     )
+                    for label, _, route, _ in _SCREENS
+                ]
+                Screen.objects.using(using).bulk_create([home, *screen_objs], batch_size=settings.WIDGETS_APP_BATCH_SIZE)
+                screen_refs = {}
+                for (label, _, _, slug), screen in zip(_SCREENS, screen_objs):
+                    screen._slug = slug
                     screen_refs[label] = screen
-                    # Build screen widgets
-                    builder(app, screen)
+
+                # One collector for every screen, flushed once at the end
+                collector = WidgetCollector(using)
+
+                # Build screen widgets
+                for (_, builder_name, _, _), screen in zip(_SCREENS, screen_objs):
+                    getattr(self, builder_name)(screen, collector)
                     # Property editor FAB is injected by the screen generator globally per screen
 
                 # Create navigation actions from Home
-                for label, screen in screen_refs.items():
-                    action = Action.objects.create(
+                actions = [
+                    collector.add_action(
                         application=app,
                         name=f"Open {label}",
                         action_type='navigate',
                         target_screen=screen
                     )
-                    actions_map[label] = action
+                    for label, screen in screen_refs.items()
+                ]
 
                 # Build Home content: scrollable list of buttons
-                home_col = Widget.objects.create(screen=home, widget_type='Column', order=0, widget_id='home_col')
+                home_col = collector.add_widget(screen=home, widget_type='Column', order=0, widget_id='home_col')
 
                 # Title
-                title = Widget.objects.create(screen=home, widget_type='Text', parent_widget=home_col, order=0, widget_id='home_title')
-                WidgetProperty.objects.create(widget=title, property_name='text', property_type='string', string_value='Widgets Showcase')
-                WidgetProperty.objects.create(widget=title, property_name='fontSize', property_type='integer', integer_value=22)
-                WidgetProperty.objects.create(widget=title, property_name='fontWeight', property_type='string', string_value='bold')
+                title = collector.add_widget(screen=home, widget_type='Text', parent_widget=home_col, order=0, widget_id='home_title')
+                collector.add_property(title, 'text', 'string', 'Widgets Showcase')
+                collector.add_property(title, 'fontSize', 'integer', 22)
+                collector.add_property(title, 'fontWeight', 'string', 'bold')
 
                 # Buttons list
-                buttons_list = Widget.objects.create(screen=home, widget_type='ListView', parent_widget=home_col, order=1, widget_id='home_buttons_list')
-                WidgetProperty.objects.create(widget=buttons_list, property_name='padding', property_type='integer', integer_value=8)
+                buttons_list = collector.add_widget(screen=home, widget_type='ListView', parent_widget=home_col, order=1, widget_id='home_buttons_list')
+                collector.add_property(buttons_list, 'padding', 'integer', 8)
 
                 # Create a button per screen
-                order = 0
-                for label, action in actions_map.items():
-                    btn = Widget.objects.create(screen=home, widget_type='ElevatedButton', parent_widget=buttons_list, order=order, widget_id=f"btn_{order}")
-                    WidgetProperty.objects.create(widget=btn, property_name='text', property_type='string', string_value=label)
-                    WidgetProperty.objects.create(widget=btn, property_name='onPressed', property_type='action_reference', action_reference=action)
-                    WidgetProperty.objects.create(widget=btn, property_name='padding', property_type='integer', integer_value=12)
-                    order += 1
-
-                self.stdout.write(self.style.SUCCESS(f"Successfully created Widgets App: {app.name}"))
+                add_widget = collector.add_widget
+                add_property = collector.add_property
+                for order, (label, action) in enumerate(zip(screen_refs, actions)):
+                    btn = add_widget(screen=home, widget_type='ElevatedButton', parent_widget=buttons_list, order=order, widget_id=f"btn_{order}")
+                    add_property(btn, 'text', 'string', label)
+                    add_property(btn, 'onPressed', 'action_reference', action)
+                    add_property(btn, 'padding', 'integer', 12)
+                collector.flush()
+
+                transaction.on_commit(
+                    lambda name=app.name: self.stdout.write(self.style.SUCCESS(f"Successfully created Widgets App: {name}")),
+                    using=using,
+                )
 
         except Exception as e:
             self.stdout.write(self.style.ERROR(f"Error creating Widgets App: {str(e)}"))
 
-    def _create_app(self, name: str, package: str):
-        theme = Theme.objects.create(
+    def _create_app(self, name: str, package: str, using: str = DEFAULT_DB_ALIAS):
+        theme = Theme(
             name='Widgets Theme',
             primary_color='#1976D2',
             accent_color='#E91E63',
@@ -141,385 +590,171 @@ class Command(BaseCommand):
             font_family='Roboto',
             is_dark_mode=False,
         )
-        app = Application.objects.create(
+        theme.save(force_insert=True, using=using)
+        app = Application(
             name=name,
             description='Showcase of all widgets and properties',
             package_name=package,
             version='1.0.0',
             theme=theme,
         )
+        app.save(force_insert=True, using=using)
         return app
 
-    def _add_properties_fab(self, app: Application, screen: Screen, title: str, message: str):
+    def _add_properties_fab(self, screen: Screen, collector, title: str, message: str):
         # Build a page-specific bottom sheet editor launcher
-        fab = Widget.objects.create(screen=screen, widget_type='FloatingActionButton', order=999, widget_id=f"fab_{screen.name.lower().replace(' ','_')}")
-        WidgetProperty.objects.create(widget=fab, property_name='icon', property_type='string', string_value='edit')
+        fab = collector.add_widget(screen=screen, widget_type='FloatingActionButton', order=999, widget_id=f"fab_{screen._slug}")
+        collector.add_property(fab, 'icon', 'string', 'edit')
 
     # ---- Screen builders ----
-    def _build_container_screen(self, app: Application, screen: Screen):
-        cont = Widget.objects.create(screen=screen, widget_type='Container', order=0, widget_id='container_demo')
-        # Size, spacing
-        WidgetProperty.objects.create(widget=cont, property_name='width', property_type='integer', integer_value=320)
-        WidgetProperty.objects.create(widget=cont, property_name='height', property_type='integer', integer_value=160)
-        WidgetProperty.objects.create(widget=cont, property_name='padding', property_type='integer', integer_value=16)
-        WidgetProperty.objects.create(widget=cont, property_name='margin', property_type='integer', integer_value=12)
-        # Decoration and alignment
-        WidgetProperty.objects.create(widget=cont, property_name='color', property_type='color', color_value='#F5F5F5')
-        WidgetProperty.objects.create(widget=cont, property_name='alignment', property_type='alignment', alignment_value='center')
-        WidgetProperty.objects.create(widget=cont, property_name='borderRadius', property_type='integer', integer_value=12)
-        WidgetProperty.objects.create(widget=cont, property_name='borderColor', property_type='color', color_value='#1976D2')
-        WidgetProperty.objects.create(widget=cont, property_name='borderWidth', property_type='integer', integer_value=2)
-        WidgetProperty.objects.create(widget=cont, property_name='boxShadowColor', property_type='color', color_value='#55000000')
-        WidgetProperty.objects.create(widget=cont, property_name='boxShadowBlur', property_type='integer', integer_value=8)
-        WidgetProperty.objects.create(widget=cont, property_name='boxShadowSpread', property_type='integer', integer_value=1)
-        WidgetProperty.objects.create(widget=cont, property_name='boxShadowOffsetX', property_type='integer', integer_value=0)
-        WidgetProperty.objects.create(widget=cont, property_name='boxShadowOffsetY', property_type='integer', integer_value=2)
-        WidgetProperty.objects.create(widget=cont, property_name='gradientStart', property_type='color', color_value='#1976D2')
-        WidgetProperty.objects.create(widget=cont, property_name='gradientEnd', property_type='color', color_value='#E91E63')
-        # Constraints
-        WidgetProperty.objects.create(widget=cont, property_name='minWidth', property_type='integer', integer_value=200)
-        WidgetProperty.objects.create(widget=cont, property_name='maxWidth', property_type='integer', integer_value=360)
-        WidgetProperty.objects.create(widget=cont, property_name='minHeight', property_type='integer', integer_value=120)
-        WidgetProperty.objects.create(widget=cont, property_name='maxHeight', property_type='integer', integer_value=180)
-        # Child
-        txt = Widget.objects.create(screen=screen, widget_type='Text', parent_widget=cont, order=0, widget_id='container_text')
-        WidgetProperty.objects.create(widget=txt, property_name='text', property_type='string', string_value='Container with decoration, constraints, padding, margin')
-        WidgetProperty.objects.create(widget=txt, property_name='fontSize', property_type='integer', integer_value=14)
-
-    def _build_column_screen(self, app: Application, screen: Screen):
-        col = Widget.objects.create(screen=screen, widget_type='Column', order=0, widget_id='column_demo')
-        WidgetProperty.objects.create(widget=col, property_name='mainAxisAlignment', property_type='string', string_value='spaceBetween')
-        WidgetProperty.objects.create(widget=col, property_name='crossAxisAlignment', property_type='string', string_value='center')
-        WidgetProperty.objects.create(widget=col, property_name='spacing', property_type='integer', integer_value=12)
-        WidgetProperty.objects.create(widget=col, property_name='padding', property_type='integer', integer_value=16)
+    def _build_spec_screen(self, screen: Screen, collector):
+        add_widget = collector.add_widget
+        add_properties = collector.add_properties
+        built = {}
+        for widget_type, parent_id, order, widget_id, props in SCREEN_SPECS[screen.name]:
+            widget = add_widget(screen=screen, widget_type=widget_type, parent_widget=built.get(parent_id), order=order, widget_id=widget_id)
+            add_properties(widget, props)
+            built[widget_id] = widget
+
+    def _build_column_screen(self, screen: Screen, collector):
+        add_widget = collector.add_widget
+        add_property = collector.add_property
+        col = add_widget(screen=screen, widget_type='Column', order=0, widget_id='column_demo')
+        add_property(col, 'mainAxisAlignment', 'string', 'spaceBetween')
+        add_property(col, 'crossAxisAlignment', 'string', 'center')
+        add_property(col, 'spacing', 'integer', 12)
+        add_property(col, 'padding', 'integer', 16)
         # Children
-        for i in range(3):
-            b = Widget.objects.create(screen=screen, widget_type='ElevatedButton', parent_widget=col, order=i, widget_id=f'col_btn_{i}')
-            WidgetProperty.objects.create(widget=b, property_name='text', property_type='string', string_value=f'Button {i+1}')
-
-    def _build_row_screen(self, app: Application, screen: Screen):
-        row = Widget.objects.create(screen=screen, widget_type='Row', order=0, widget_id='row_demo')
-        WidgetProperty.objects.create(widget=row, property_name='mainAxisAlignment', property_type='string', string_value='spaceAround')
-        WidgetProperty.objects.create(widget=row, property_name='crossAxisAlignment', property_type='string', string_value='center')
-        WidgetProperty.objects.create(widget=row, property_name='spacing', property_type='integer', integer_value=16)
-        for i in range(3):
-            t = Widget.objects.create(screen=screen, widget_type='Text', parent_widget=row, order=i, widget_id=f'row_text_{i}')
-            WidgetProperty.objects.create(widget=t, property_name='text', property_type='string', string_value=f'Item {i+1}')
-
-    def _build_stack_screen(self, app: Application, screen: Screen):
-        stack = Widget.objects.create(screen=screen, widget_type='Stack', order=0, widget_id='stack_demo')
-        base = Widget.objects.create(screen=screen, widget_type='Container', parent_widget=stack, order=0, widget_id='stack_base')
-        WidgetProperty.objects.create(widget=base, property_name='width', property_type='integer', integer_value=300)
-        WidgetProperty.objects.create(widget=base, property_name='height', property_type='integer', integer_value=160)
-        WidgetProperty.objects.create(widget=base, property_name='color', property_type='color', color_value='#BBDEFB')
-        pos = Widget.objects.create(screen=screen, widget_type='Positioned', parent_widget=stack, order=1, widget_id='stack_pos')
-        WidgetProperty.objects.create(widget=pos, property_name='top', property_type='integer', integer_value=16)
-        WidgetProperty.objects.create(widget=pos, property_name='left', property_type='integer', integer_value=16)
-        WidgetProperty.objects.create(widget=pos, property_name='width', property_type='integer', integer_value=120)
-        WidgetProperty.objects.create(widget=pos, property_name='height', property_type='integer', integer_value=80)
-        inner = Widget.objects.create(screen=screen, widget_type='Container', parent_widget=pos, order=0, widget_id='stack_inner')
-        WidgetProperty.objects.create(widget=inner, property_name='color', property_type='color', color_value='#1976D2')
-
-    def _build_center_screen(self, app: Application, screen: Screen):
-        c = Widget.objects.create(screen=screen, widget_type='Center', order=0, widget_id='center_demo')
-        WidgetProperty.objects.create(widget=c, property_name='widthFactor', property_type='decimal', decimal_value=1.2)
-        WidgetProperty.objects.create(widget=c, property_name='heightFactor', property_type='decimal', decimal_value=1.2)
-        t = Widget.objects.create(screen=screen, widget_type='Text', parent_widget=c, order=0, widget_id='center_text')
-        WidgetProperty.objects.create(widget=t, property_name='text', property_type='string', string_value='Centered content with factors')
-
-    def _build_padding_screen(self, app: Application, screen: Screen):
-        p = Widget.objects.create(screen=screen, widget_type='Padding', order=0, widget_id='padding_demo')
-        WidgetProperty.objects.create(widget=p, property_name='padding', property_type='integer', integer_value=24)
-        t = Widget.objects.create(screen=screen, widget_type='Text', parent_widget=p, order=0, widget_id='padding_text')
-        WidgetProperty.objects.create(widget=t, property_name='text', property_type='string', string_value='Padding applied')
-
-    def _build_sizedbox_screen(self, app: Application, screen: Screen):
-        s = Widget.objects.create(screen=screen, widget_type='SizedBox', order=0, widget_id='sized_demo')
-        WidgetProperty.objects.create(widget=s, property_name='width', property_type='integer', integer_value=220)
-        WidgetProperty.objects.create(widget=s, property_name='height', property_type='integer', integer_value=60)
-
-    def _build_expand_flexible_screen(self, app: Application, screen: Screen):
-        row = Widget.objects.create(screen=screen, widget_type='Row', order=0, widget_id='expand_row')
-        exp = Widget.objects.create(screen=screen, widget_type='Expanded', parent_widget=row, order=0, widget_id='expanded_demo')
-        WidgetProperty.objects.create(widget=exp, property_name='flex', property_type='integer', integer_value=2)
-        Widget.objects.create(screen=screen, widget_type='Text', parent_widget=exp, order=0, widget_id='expanded_text')
-        flx = Widget.objects.create(screen=screen, widget_type='Flexible', parent_widget=row, order=1, widget_id='flexible_demo')
-        WidgetProperty.objects.create(widget=flx, property_name='flex', property_type='integer', integer_value=1)
-        WidgetProperty.objects.create(widget=flx, property_name='fit', property_type='string', string_value='tight')
-        Widget.objects.create(screen=screen, widget_type='Text', parent_widget=flx, order=0, widget_id='flexible_text')
-
-    def _build_align_screen(self, app: Application, screen: Screen):
-        al = Widget.objects.create(screen=screen, widget_type='Align', order=0, widget_id='align_demo')
-        WidgetProperty.objects.create(widget=al, property_name='alignment', property_type='alignment', alignment_value='bottomRight')
-        Widget.objects.create(screen=screen, widget_type='Text', parent_widget=al, order=0, widget_id='align_text')
-
-    def _build_positioned_screen(self, app: Application, screen: Screen):
-        self._build_stack_screen(app, screen)
-
-    def _build_scrollview_screen(self, app: Application, screen: Screen):
-        sc = Widget.objects.create(screen=screen, widget_type='SingleChildScrollView', order=0, widget_id='scsv_demo')
-        WidgetProperty.objects.create(widget=sc, property_name='padding', property_type='integer', integer_value=12)
-        col = Widget.objects.create(screen=screen, widget_type='Column', parent_widget=sc, order=0, widget_id='scsv_col')
-        for i in range(10):
-            t = Widget.objects.create(screen=screen, widget_type='Text', parent_widget=col, order=i, widget_id=f'scsv_t_{i}')
-            WidgetProperty.objects.create(widget=t, property_name='text', property_type='string', string_value=f'Item {i+1}')
-
-    def _build_pageview_screen(self, app: Application, screen: Screen):
-        pv = Widget.objects.create(screen=screen, widget_type='PageView', order=0, widget_id='pageview_demo')
-        for i, color in enumerate(['#FFCDD2', '#C8E6C9', '#BBDEFB']):
-            c = Widget.objects.create(screen=screen, widget_type='Container', parent_widget=pv, order=i, widget_id=f'pv_{i}')
-            WidgetProperty.objects.create(widget=c, property_name='color', property_type='color', color_value=color)
-            t = Widget.objects.create(screen=screen, widget_type='Text', parent_widget=c, order=0, widget_id=f'pv_t_{i}')
-            WidgetProperty.objects.create(widget=t, property_name='text', property_type='string', string_value=f'Page {i+1}')
-
-    def _build_safearea_screen(self, app: Application, screen: Screen):
-        sa = Widget.objects.create(screen=screen, widget_type='SafeArea', order=0, widget_id='safearea_demo')
-        t = Widget.objects.create(screen=screen, widget_type='Text', parent_widget=sa, order=0, widget_id='sa_text')
-        WidgetProperty.objects.create(widget=t, property_name='text', property_type='string', string_value='Safe area content')
-
-    def _build_future_stream_screen(self, app: Application, screen: Screen):
-        fb = Widget.objects.create(screen=screen, widget_type='FutureBuilder', order=0, widget_id='fb_placeholder')
-        Widget.objects.create(screen=screen, widget_type='StreamBuilder', order=1, widget_id='sb_placeholder')
-
-    def _build_text_screen(self, app: Application, screen: Screen):
-        t = Widget.objects.create(screen=screen, widget_type='Text', order=0, widget_id='text_demo')
-        WidgetProperty.objects.create(widget=t, property_name='text', property_type='string', string_value='Styled Text Example')
-        WidgetProperty.objects.create(widget=t, property_name='fontSize', property_type='integer', integer_value=20)
-        WidgetProperty.objects.create(widget=t, property_name='fontWeight', property_type='string', string_value='bold')
-        WidgetProperty.objects.create(widget=t, property_name='fontStyle', property_type='string', string_value='italic')
-        WidgetProperty.objects.create(widget=t, property_name='color', property_type='color', color_value='#1976D2')
-        WidgetProperty.objects.create(widget=t, property_name='fontFamily', property_type='string', string_value='Roboto')
-        WidgetProperty.objects.create(widget=t, property_name='letterSpacing', property_type='decimal', decimal_value=1.2)
-        WidgetProperty.objects.create(widget=t, property_name='wordSpacing', property_type='decimal', decimal_value=2.0)
-        WidgetProperty.objects.create(widget=t, property_name='height', property_type='decimal', decimal_value=1.3)
-        WidgetProperty.objects.create(widget=t, property_name='decoration', property_type='string', string_value='underline')
-        WidgetProperty.objects.create(widget=t, property_name='decorationColor', property_type='color', color_value='#E91E63')
-        WidgetProperty.objects.create(widget=t, property_name='decorationStyle', property_type='string', string_value='dashed')
-        WidgetProperty.objects.create(widget=t, property_name='decorationThickness', property_type='decimal', decimal_value=2.0)
-        WidgetProperty.objects.create(widget=t, property_name='textAlign', property_type='string', string_value='center')
-        WidgetProperty.objects.create(widget=t, property_name='softWrap', property_type='boolean', boolean_value=True)
-        WidgetProperty.objects.create(widget=t, property_name='overflow', property_type='string', string_value='ellipsis')
-        WidgetProperty.objects.create(widget=t, property_name='maxLines', property_type='integer', integer_value=2)
-
-    def _build_richtext_screen(self, app: Application, screen: Screen):
-        rt = Widget.objects.create(screen=screen, widget_type='RichText', order=0, widget_id='richtext_demo')
-        WidgetProperty.objects.create(widget=rt, property_name='text', property_type='string', string_value='RichText demo content')
-
-    def _build_image_screen(self, app: Application, screen: Screen):
-        im = Widget.objects.create(screen=screen, widget_type='Image', order=0, widget_id='image_demo')
-        WidgetProperty.objects.create(widget=im, property_name='imageUrl', property_type='url', url_value='https://picsum.photos/400/200')
-        WidgetProperty.objects.create(widget=im, property_name='width', property_type='integer', integer_value=300)
-        WidgetProperty.objects.create(widget=im, property_name='height', property_type='integer', integer_value=150)
-        WidgetProperty.objects.create(widget=im, property_name='fit', property_type='string', string_value='cover')
-        WidgetProperty.objects.create(widget=im, property_name='alignment', property_type='alignment', alignment_value='center')
-        WidgetProperty.objects.create(widget=im, property_name='repeat', property_type='string', string_value='noRepeat')
-        WidgetProperty.objects.create(widget=im, property_name='opacity', property_type='decimal', decimal_value=0.95)
-        WidgetProperty.objects.create(widget=im, property_name='colorBlendMode', property_type='string', string_value='srcOver')
-        WidgetProperty.objects.create(widget=im, property_name='scale', property_type='decimal', decimal_value=1.0)
-
-    def _build_icon_screen(self, app: Application, screen: Screen):
-        ic = Widget.objects.create(screen=screen, widget_type='Icon', order=0, widget_id='icon_demo')
-        WidgetProperty.objects.create(widget=ic, property_name='icon', property_type='string', string_value='home')
-        WidgetProperty.objects.create(widget=ic, property_name='size', property_type='integer', integer_value=48)
-        WidgetProperty.objects.create(widget=ic, property_name='color', property_type='color', color_value='#FF5722')
-
-    def _build_textfield_screen(self, app: Application, screen: Screen):
-        tf = Widget.objects.create(screen=screen, widget_type='TextField', order=0, widget_id='textfield_demo')
-        WidgetProperty.objects.create(widget=tf, property_name='labelText', property_type='string', string_value='Email')
-        WidgetProperty.objects.create(widget=tf, property_name='hintText', property_type='string', string_value='enter your email')
-        WidgetProperty.objects.create(widget=tf, property_name='obscureText', property_type='boolean', boolean_value=False)
-        # Extras (editor shows but backend may ignore gracefully)
-        WidgetProperty.objects.create(widget=tf, property_name='prefixIcon', property_type='string', string_value='email')
-        WidgetProperty.objects.create(widget=tf, property_name='filled', property_type='boolean', boolean_value=True)
-        WidgetProperty.objects.create(widget=tf, property_name='fillColor', property_type='color', color_value='#FFFDE7')
-        WidgetProperty.objects.create(widget=tf, property_name='borderRadius', property_type='integer', integer_value=8)
-        WidgetProperty.objects.create(widget=tf, property_name='helperText', property_type='string', string_value='We will not share your email.')
-
-    def _build_textbutton_screen(self, app: Application, screen: Screen):
-        b = Widget.objects.create(screen=screen, widget_type='TextButton', order=0, widget_id='textbutton_demo')
-        WidgetProperty.objects.create(widget=b, property_name='text', property_type='string', string_value='TextButton')
-        WidgetProperty.objects.create(widget=b, property_name='foregroundColor', property_type='color', color_value='#1976D2')
-        WidgetProperty.objects.create(widget=b, property_name='padding', property_type='integer', integer_value=12)
-
-    def _build_outlinedbutton_screen(self, app: Application, screen: Screen):
-        b = Widget.objects.create(screen=screen, widget_type='OutlinedButton', order=0, widget_id='outlinedbutton_demo')
-        WidgetProperty.objects.create(widget=b, property_name='text', property_type='string', string_value='OutlinedButton')
-        WidgetProperty.objects.create(widget=b, property_name='borderColor', property_type='color', color_value='#1976D2')
-        WidgetProperty.objects.create(widget=b, property_name='borderWidth', property_type='integer', integer_value=2)
-        WidgetProperty.objects.create(widget=b, property_name='borderRadius', property_type='integer', integer_value=8)
-
-    def _build_iconbutton_screen(self, app: Application, screen: Screen):
-        ib = Widget.objects.create(screen=screen, widget_type='IconButton', order=0, widget_id='iconbutton_demo')
-        WidgetProperty.objects.create(widget=ib, property_name='icon', property_type='string', string_value='favorite')
-        WidgetProperty.objects.create(widget=ib, property_name='color', property_type='color', color_value='#E91E63')
-        WidgetProperty.objects.create(widget=ib, property_name='size', property_type='integer', integer_value=28)
-        WidgetProperty.objects.create(widget=ib, property_name='splashRadius', property_type='integer', integer_value=22)
-
-    def _build_fab_only_screen(self, app: Application, screen: Screen):
-        fb = Widget.objects.create(screen=screen, widget_type='FloatingActionButton', order=0, widget_id='fab_demo')
-        WidgetProperty.objects.create(widget=fb, property_name='icon', property_type='string', string_value='add')
-        WidgetProperty.objects.create(widget=fb, property_name='backgroundColor', property_type='color', color_value='#1976D2')
-        WidgetProperty.objects.create(widget=fb, property_name='foregroundColor', property_type='color', color_value='#FFFFFF')
-        # Use either mini or extended, not both (extended doesn't support mini)
-        WidgetProperty.objects.create(widget=fb, property_name='extended', property_type='boolean', boolean_value=True)
-        WidgetProperty.objects.create(widget=fb, property_name='label', property_type='string', string_value='Create')
-
-    def _build_switch_screen(self, app: Application, screen: Screen):
-        sw = Widget.objects.create(screen=screen, widget_type='Switch', order=0, widget_id='switch_demo')
-        WidgetProperty.objects.create(widget=sw, property_name='value', property_type='boolean', boolean_value=True)
-
-    def _build_checkbox_screen(self, app: Application, screen: Screen):
-        cb = Widget.objects.create(screen=screen, widget_type='Checkbox', order=0, widget_id='checkbox_demo')
-        WidgetProperty.objects.create(widget=cb, property_name='value', property_type='boolean', boolean_value=True)
-
-    def _build_radio_screen(self, app: Application, screen: Screen):
-        rd = Widget.objects.create(screen=screen, widget_type='Radio', order=0, widget_id='radio_demo')
-        WidgetProperty.objects.create(widget=rd, property_name='value', property_type='string', string_value='A')
-        WidgetProperty.objects.create(widget=rd, property_name='groupValue', property_type='string', string_value='A')
-
-    def _build_slider_screen(self, app: Application, screen: Screen):
-        sl = Widget.objects.create(screen=screen, widget_type='Slider', order=0, widget_id='slider_demo')
-        WidgetProperty.objects.create(widget=sl, property_name='value', property_type='decimal', decimal_value=0.5)
-        WidgetProperty.objects.create(widget=sl, property_name='min', property_type='decimal', decimal_value=0.0)
-        WidgetProperty.objects.create(widget=sl, property_name='max', property_type='decimal', decimal_value=1.0)
-
-    def _build_dropdown_screen(self, app: Application, screen: Screen):
-        dd = Widget.objects.create(screen=screen, widget_type='DropdownButton', order=0, widget_id='dropdown_demo')
-        WidgetProperty.objects.create(widget=dd, property_name='items', property_type='string', string_value='Red,Green,Blue')
-        WidgetProperty.objects.create(widget=dd, property_name='value', property_type='string', string_value='Green')
-
-    def _build_divider_screen(self, app: Application, screen: Screen):
-        d = Widget.objects.create(screen=screen, widget_type='Divider', order=0, widget_id='divider_demo')
-        WidgetProperty.objects.create(widget=d, property_name='height', property_type='integer', integer_value=24)
-        WidgetProperty.objects.create(widget=d, property_name='thickness', property_type='integer', integer_value=2)
-        WidgetProperty.objects.create(widget=d, property_name='indent', property_type='integer', integer_value=16)
-        WidgetProperty.objects.create(widget=d, property_name='endIndent', property_type='integer', integer_value=16)
-        WidgetProperty.objects.create(widget=d, property_name='color', property_type='color', color_value='#9E9E9E')
-
-        t = Widget.objects.create(screen=screen, widget_type='Text', order=1, widget_id='divider_note')
-        WidgetProperty.objects.create(widget=t, property_name='text', property_type='string', string_value='Divider above has height, thickness, indent, endIndent and color')
-
-    def _build_card_screen(self, app: Application, screen: Screen):
-        c = Widget.objects.create(screen=screen, widget_type='Card', order=0, widget_id='card_demo')
-        WidgetProperty.objects.create(widget=c, property_name='elevation', property_type='integer', integer_value=6)
-        WidgetProperty.objects.create(widget=c, property_name='margin', property_type='integer', integer_value=12)
-        WidgetProperty.objects.create(widget=c, property_name='color', property_type='color', color_value='#FFF3E0')
-        WidgetProperty.objects.create(widget=c, property_name='shadowColor', property_type='color', color_value='#FF9800')
-        WidgetProperty.objects.create(widget=c, property_name='borderRadius', property_type='integer', integer_value=12)
-        inner = Widget.objects.create(screen=screen, widget_type='Text', parent_widget=c, order=0, widget_id='card_text')
-        WidgetProperty.objects.create(widget=inner, property_name='text', property_type='string', string_value='Card with color, elevation, borderRadius and padding')
-        WidgetProperty.objects.create(widget=c, property_name='padding', property_type='integer', integer_value=16)
-
-    def _build_listtile_screen(self, app: Application, screen: Screen):
-        lt = Widget.objects.create(screen=screen, widget_type='ListTile', order=0, widget_id='listtile_demo')
-        WidgetProperty.objects.create(widget=lt, property_name='title', property_type='string', string_value='ListTile Title')
-        WidgetProperty.objects.create(widget=lt, property_name='subtitle', property_type='string', string_value='Subtitle text')
-        WidgetProperty.objects.create(widget=lt, property_name='leading', property_type='string', string_value='star')
-        WidgetProperty.objects.create(widget=lt, property_name='trailing', property_type='string', string_value='chevron_right')
-        WidgetProperty.objects.create(widget=lt, property_name='tileColor', property_type='color', color_value='#E0F7FA')
-        WidgetProperty.objects.create(widget=lt, property_name='contentPadding', property_type='integer', integer_value=12)
-
-    def _build_listview_screen(self, app: Application, screen: Screen):
-        lv = Widget.objects.create(screen=screen, widget_type='ListView', order=0, widget_id='listview_demo')
-        WidgetProperty.objects.create(widget=lv, property_name='scrollDirection', property_type='string', string_value='vertical')
-        WidgetProperty.objects.create(widget=lv, property_name='padding', property_type='integer', integer_value=8)
-        for i in range(5):
-            t = Widget.objects.create(screen=screen, widget_type='Text', parent_widget=lv, order=i, widget_id=f'lv_t_{i}')
-            WidgetProperty.objects.create(widget=t, property_name='text', property_type='string', string_value=f'List item {i+1}')
-
-    def _build_gridview_screen(self, app: Application, screen: Screen):
-        gv = Widget.objects.create(screen=screen, widget_type='GridView', order=0, widget_id='gridview_demo')
-        WidgetProperty.objects.create(widget=gv, property_name='crossAxisCount', property_type='integer', integer_value=3)
-        WidgetProperty.objects.create(widget=gv, property_name='childAspectRatio', property_type='decimal', decimal_value=1.0)
-        WidgetProperty.objects.create(widget=gv, property_name='padding', property_type='integer', integer_value=8)
-
-    def _build_tooltip_screen(self, app: Application, screen: Screen):
-        tp = Widget.objects.create(screen=screen, widget_type='Tooltip', order=0, widget_id='tooltip_demo')
-        WidgetProperty.objects.create(widget=tp, property_name='message', property_type='string', string_value='Tooltip message')
-        WidgetProperty.objects.create(widget=tp, property_name='padding', property_type='integer', integer_value=8)
-        WidgetProperty.objects.create(widget=tp, property_name='margin', property_type='integer', integer_value=8)
-        btn = Widget.objects.create(screen=screen, widget_type='ElevatedButton', parent_widget=tp, order=0, widget_id='tooltip_btn')
-        WidgetProperty.objects.create(widget=btn, property_name='text', property_type='string', string_value='Hover me')
-
-    def _build_bottomnav_screen(self, app: Application, screen: Screen):
+        for i, (widget_id, text) in enumerate(_COL_BUTTONS):
+            b = add_widget(screen=screen, widget_type='ElevatedButton', parent_widget=col, order=i, widget_id=widget_id)
+            add_property(b, 'text', 'string', text)
+
+    def _build_row_screen(self, screen: Screen, collector):
+        add_widget = collector.add_widget
+        add_property = collector.add_property
+        row = add_widget(screen=screen, widget_type='Row', order=0, widget_id='row_demo')
+        add_property(row, 'mainAxisAlignment', 'string', 'spaceAround')
+        add_property(row, 'crossAxisAlignment', 'string', 'center')
+        add_property(row, 'spacing', 'integer', 16)
+        for i, (widget_id, text) in enumerate(_ROW_ITEMS):
+            t = add_widget(screen=screen, widget_type='Text', parent_widget=row, order=i, widget_id=widget_id)
+            add_property(t, 'text', 'string', text)
+
+    def _build_scrollview_screen(self, screen: Screen, collector):
+        add_widget = collector.add_widget
+        add_property = collector.add_property
+        sc = add_widget(screen=screen, widget_type='SingleChildScrollView', order=0, widget_id='scsv_demo')
+        add_property(sc, 'padding', 'integer', 12)
+        col = add_widget(screen=screen, widget_type='Column', parent_widget=sc, order=0, widget_id='scsv_col')
+        for i, (widget_id, text) in enumerate(_SCSV_ITEMS):
+            t = add_widget(screen=screen, widget_type='Text', parent_widget=col, order=i, widget_id=widget_id)
+            add_property(t, 'text', 'string', text)
+
+    def _build_pageview_screen(self, screen: Screen, collector):
+        add_widget = collector.add_widget
+        add_property = collector.add_property
+        pv = add_widget(screen=screen, widget_type='PageView', order=0, widget_id='pageview_demo')
+        for i, (color, (page_id, text_id, text)) in enumerate(zip(TAB_COLORS, _PAGE_IDS, strict=True)):
+            c = add_widget(screen=screen, widget_type='Container', parent_widget=pv, order=i, widget_id=page_id)
+            add_property(c, 'color', 'color', color)
+            t = add_widget(screen=screen, widget_type='Text', parent_widget=c, order=0, widget_id=text_id)
+            add_property(t, 'text', 'string', text)
+
+    def _build_richtext_screen(self, screen: Screen, collector):
+        rt = collector.add_widget(screen=screen, widget_type='RichText', order=0, widget_id='richtext_demo')
+        collector.add_property(rt, 'text', 'string', 'RichText demo content')
+
+    def _build_listview_screen(self, screen: Screen, collector):
+        add_widget = collector.add_widget
+        add_property = collector.add_property
+        lv = add_widget(screen=screen, widget_type='ListView', order=0, widget_id='listview_demo')
+        add_property(lv, 'scrollDirection', 'string', 'vertical')
+        add_property(lv, 'padding', 'integer', 8)
+        for i, (widget_id, text) in enumerate(_LV_ITEMS):
+            t = add_widget(screen=screen, widget_type='Text', parent_widget=lv, order=i, widget_id=widget_id)
+            add_property(t, 'text', 'string', text)
+
+    def _build_bottomnav_screen(self, screen: Screen, collector):
+        add_widget = collector.add_widget
+        add_property = collector.add_property
         # Build BottomNavigationBar with 3 items
-        bnav = Widget.objects.create(screen=screen, widget_type='BottomNavigationBar', order=0, widget_id='bottomnav_demo')
-        WidgetProperty.objects.create(widget=bnav, property_name='currentIndex', property_type='integer', integer_value=0)
-        WidgetProperty.objects.create(widget=bnav, property_name='backgroundColor', property_type='color', color_value='#FFFFFF')
-        WidgetProperty.objects.create(widget=bnav, property_name='selectedItemColor', property_type='color', color_value='#1976D2')
-        WidgetProperty.objects.create(widget=bnav, property_name='unselectedItemColor', property_type='color', color_value='#9E9E9E')
-        WidgetProperty.objects.create(widget=bnav, property_name='iconSize', property_type='integer', integer_value=22)
-        WidgetProperty.objects.create(widget=bnav, property_name='elevation', property_type='integer', integer_value=8)
-        for i, (icon, label) in enumerate([('home', 'Home'), ('search', 'Search'), ('person', 'Profile')]):
-            item = Widget.objects.create(screen=screen, widget_type='Container', parent_widget=bnav, order=i, widget_id=f'bn_item_{i}')
-            WidgetProperty.objects.create(widget=item, property_name='icon', property_type='string', string_value=icon)
-            WidgetProperty.objects.create(widget=item, property_name='label', property_type='string', string_value=label)
-
-    def _build_tabs_screen(self, app: Application, screen: Screen):
-        tabs = Widget.objects.create(screen=screen, widget_type='TabBar', order=0, widget_id='tabbar_demo')
-        for i in range(3):
-            tab = Widget.objects.create(screen=screen, widget_type='Text', parent_widget=tabs, order=i, widget_id=f'tab_{i}')
-            WidgetProperty.objects.create(widget=tab, property_name='text', property_type='string', string_value=f'Tab {i+1}')
-        tbv = Widget.objects.create(screen=screen, widget_type='TabBarView', order=1, widget_id='tabbarview_demo')
-        for i in range(3):
-            cont = Widget.objects.create(screen=screen, widget_type='Container', parent_widget=tbv, order=i, widget_id=f'tbv_c_{i}')
-            WidgetProperty.objects.create(widget=cont, property_name='height', property_type='integer', integer_value=200)
-            WidgetProperty.objects.create(widget=cont, property_name='color', property_type='color', color_value=['#FFCDD2', '#C8E6C9', '#BBDEFB'][i])
-            txt = Widget.objects.create(screen=screen, widget_type='Text', parent_widget=cont, order=0, widget_id=f'tbv_t_{i}')
-            WidgetProperty.objects.create(widget=txt, property_name='text', property_type='string', string_value=f'Content of Tab {i+1}')
-
-    def _build_dialog_screen(self, app: Application, screen: Screen):
-        col = Widget.objects.create(screen=screen, widget_type='Column', order=0, widget_id='dialog_col')
-        btn = Widget.objects.create(screen=screen, widget_type='ElevatedButton', parent_widget=col, order=0, widget_id='dialog_btn')
-        WidgetProperty.objects.create(widget=btn, property_name='text', property_type='string', string_value='Open Dialog')
-        act = Action.objects.create(
-            application=app,
+        bnav = add_widget(screen=screen, widget_type='BottomNavigationBar', order=0, widget_id='bottomnav_demo')
+        add_property(bnav, 'currentIndex', 'integer', 0)
+        add_property(bnav, 'backgroundColor', 'color', '#FFFFFF')
+        add_property(bnav, 'selectedItemColor', 'color', '#1976D2')
+        add_property(bnav, 'unselectedItemColor', 'color', '#9E9E9E')
+        add_property(bnav, 'iconSize', 'integer', 22)
+        add_property(bnav, 'elevation', 'integer', 8)
+        for i, (widget_id, (icon, label)) in enumerate(zip(_BNAV_IDS, BNAV_ITEMS, strict=True)):
+            item = add_widget(screen=screen, widget_type='Container', parent_widget=bnav, order=i, widget_id=widget_id)
+            add_property(item, 'icon', 'string', icon)
+            add_property(item, 'label', 'string', label)
+
+    def _build_tabs_screen(self, screen: Screen, collector):
+        add_widget = collector.add_widget
+        add_property = collector.add_property
+        tabs = add_widget(screen=screen, widget_type='TabBar', order=0, widget_id='tabbar_demo')
+        for i, (widget_id, text) in enumerate(_TAB_ITEMS):
+            tab = add_widget(screen=screen, widget_type='Text', parent_widget=tabs, order=i, widget_id=widget_id)
+            add_property(tab, 'text', 'string', text)
+        tbv = add_widget(screen=screen, widget_type='TabBarView', order=1, widget_id='tabbarview_demo')
+        for i, (color, (cont_id, text_id, text)) in enumerate(zip(TAB_COLORS, _TAB_VIEW_IDS, strict=True)):
+            cont = add_widget(screen=screen, widget_type='Container', parent_widget=tbv, order=i, widget_id=cont_id)
+            add_property(cont, 'height', 'integer', 200)
+            add_property(cont, 'color', 'color', color)
+            txt = add_widget(screen=screen, widget_type='Text', parent_widget=cont, order=0, widget_id=text_id)
+            add_property(txt, 'text', 'string', text)
+
+    def _build_dialog_screen(self, screen: Screen, collector):
+        col = collector.add_widget(screen=screen, widget_type='Column', order=0, widget_id='dialog_col')
+        btn = collector.add_widget(screen=screen, widget_type='ElevatedButton', parent_widget=col, order=0, widget_id='dialog_btn')
+        collector.add_property(btn, 'text', 'string', 'Open Dialog')
+        act = collector.add_action(
+            application=screen.application,
             name=f"Dialog on {screen.name}",
             action_type='show_dialog',
             dialog_title='Demo Dialog',
             dialog_message='This is a demo dialog'
         )
-        WidgetProperty.objects.create(widget=btn, property_name='onPressed', property_type='action_reference', action_reference=act)
-
-    def _build_snackbar_screen(self, app: Application, screen: Screen):
-        col = Widget.objects.create(screen=screen, widget_type='Column', order=0, widget_id='snack_col')
-        btn = Widget.objects.create(screen=screen, widget_type='ElevatedButton', parent_widget=col, order=0, widget_id='snack_btn')
-        WidgetProperty.objects.create(widget=btn, property_name='text', property_type='string', string_value='Show SnackBar')
-        act = Action.objects.create(application=app, name=f"Snack on {screen.name}", action_type='show_snackbar', dialog_message='Hello SnackBar', parameters='{"backgroundColor":"#323232","durationMs":1500,"padding":8,"margin":8}')
-        WidgetProperty.objects.create(widget=btn, property_name='onPressed', property_type='action_reference', action_reference=act)
-
-    def _build_drawer_screen(self, app: Application, screen: Screen):
-        dr = Widget.objects.create(screen=screen, widget_type='Drawer', order=0, widget_id='drawer_demo')
-        WidgetProperty.objects.create(widget=dr, property_name='width', property_type='integer', integer_value=280)
-        WidgetProperty.objects.create(widget=dr, property_name='backgroundColor', property_type='color', color_value='#FFFFFF')
-        for i in range(3):
-            lt = Widget.objects.create(screen=screen, widget_type='ListTile', parent_widget=dr, order=i, widget_id=f'dr_lt_{i}')
-            WidgetProperty.objects.create(widget=lt, property_name='title', property_type='string', string_value=f'Item {i+1}')
-            WidgetProperty.objects.create(widget=lt, property_name='leading', property_type='string', string_value='chevron_right')
-
-    def _build_scaffold_screen(self, app: Application, screen: Screen):
-        sc = Widget.objects.create(screen=screen, widget_type='Scaffold', order=0, widget_id='scaffold_demo')
-        WidgetProperty.objects.create(widget=sc, property_name='backgroundColor', property_type='color', color_value='#FAFAFA')
-        body = Widget.objects.create(screen=screen, widget_type='Text', parent_widget=sc, order=0, widget_id='sc_body_text')
-        WidgetProperty.objects.create(widget=body, property_name='text', property_type='string', string_value='Scaffold body content')
-
-    def _build_aspect_wrap_screen(self, app: Application, screen: Screen):
-        ar = Widget.objects.create(screen=screen, widget_type='AspectRatio', order=0, widget_id='aspect_demo')
-        WidgetProperty.objects.create(widget=ar, property_name='aspectRatio', property_type='decimal', decimal_value=1.5)
-        wr = Widget.objects.create(screen=screen, widget_type='Wrap', order=1, widget_id='wrap_demo')
-        WidgetProperty.objects.create(widget=wr, property_name='spacing', property_type='integer', integer_value=8)
-        WidgetProperty.objects.create(widget=wr, property_name='runSpacing', property_type='integer', integer_value=8)
-        WidgetProperty.objects.create(widget=wr, property_name='direction', property_type='string', string_value='horizontal')
-        WidgetProperty.objects.create(widget=wr, property_name='alignment', property_type='string', string_value='center')
-        WidgetProperty.objects.create(widget=wr, property_name='runAlignment', property_type='string', string_value='center')
-        WidgetProperty.objects.create(widget=wr, property_name='crossAxisAlignment', property_type='string', string_value='center')
-        for i in range(6):
-            b = Widget.objects.create(screen=screen, widget_type='ElevatedButton', parent_widget=wr, order=i, widget_id=f'wrap_btn_{i}')
-            WidgetProperty.objects.create(widget=b, property_name='text', property_type='string', string_value=f'Chip {i+1}')
-
-    def _build_picker_screen(self, app: Application, screen: Screen):
-        col = Widget.objects.create(screen=screen, widget_type='Column', order=0, widget_id='picker_col')
-        d = Widget.objects.create(screen=screen, widget_type='DatePicker', parent_widget=col, order=0, widget_id='date_picker')
-        t = Widget.objects.create(screen=screen, widget_type='TimePicker', parent_widget=col, order=1, widget_id='time_picker')
+        collector.add_property(btn, 'onPressed', 'action_reference', act)
+
+    def _build_snackbar_screen(self, screen: Screen, collector):
+        col = collector.add_widget(screen=screen, widget_type='Column', order=0, widget_id='snack_col')
+        btn = collector.add_widget(screen=screen, widget_type='ElevatedButton', parent_widget=col, order=0, widget_id='snack_btn')
+        collector.add_property(btn, 'text', 'string', 'Show SnackBar')
+        act = collector.add_action(application=screen.application, name=f"Snack on {screen.name}", action_type='show_snackbar', dialog_message='Hello SnackBar', parameters='{"backgroundColor":"#323232","durationMs":1500,"padding":8,"margin":8}')
+        collector.add_property(btn, 'onPressed', 'action_reference', act)
+
+    def _build_drawer_screen(self, screen: Screen, collector):
+        add_widget = collector.add_widget
+        add_property = collector.add_property
+        dr = add_widget(screen=screen, widget_type='Drawer', order=0, widget_id='drawer_demo')
+        add_property(dr, 'width', 'integer', 280)
+        add_property(dr, 'backgroundColor', 'color', '#FFFFFF')
+        for i, (widget_id, title) in enumerate(_DRAWER_ITEMS):
+            lt = add_widget(screen=screen, widget_type='ListTile', parent_widget=dr, order=i, widget_id=widget_id)
+            add_property(lt, 'title', 'string', title)
+            add_property(lt, 'leading', 'string', 'chevron_right')
+
+    def _build_aspect_wrap_screen(self, screen: Screen, collector):
+        add_widget = collector.add_widget
+        add_property = collector.add_property
+        ar = add_widget(screen=screen, widget_type='AspectRatio', order=0, widget_id='aspect_demo')
+        add_property(ar, 'aspectRatio', 'decimal', 1.5)
+        wr = add_widget(screen=screen, widget_type='Wrap', order=1, widget_id='wrap_demo')
+        add_property(wr, 'spacing', 'integer', 8)
+        add_property(wr, 'runSpacing', 'integer', 8)
+        add_property(wr, 'direction', 'string', 'horizontal')
+        add_property(wr, 'alignment', 'string', 'center')
+        add_property(wr, 'runAlignment', 'string', 'center')
+        add_property(wr, 'crossAxisAlignment', 'string', 'center')
+        for i, (widget_id, text) in enumerate(_WRAP_CHIPS):
+            b = add_widget(screen=screen, widget_type='ElevatedButton', parent_widget=wr, order=i, widget_id=widget_id)
+            add_property(b, 'text', 'string', text)
+
+    def _build_picker_screen(self, screen: Screen, collector):
+        col = collector.add_widget(screen=screen, widget_type='Column', order=0, widget_id='picker_col')
+        d = collector.add_widget(screen=screen, widget_type='DatePicker', parent_widget=col, order=0, widget_id='date_picker')
+        t = collector.add_widget(screen=screen, widget_type='TimePicker', parent_widget=col, order=1, widget_id='time_picker')
 
 
@@ -5,15 +5,40 @@ Provides 2000+ products and all related marketplace data
 """
 
 import json
+import os
 import random
 import uuid
 from datetime import datetime, timedelta
 from .base_mock_data import BaseMockData
 
 
+def _batch_uuids(count):
+    """Iterate over count random UUID4 strings drawn from a single urandom read"""
+    buf = os.urandom(16 * count)
+    return (str(uuid.UUID(bytes=buf[i:i + 16], version=4)) for i in range(0, len(buf), 16))
+
+
 class CompleteMarketplaceMockData(BaseMockData):
     """Complete mock data provider for marketplace with 2000+ products"""
 
+    # Product price range (min, max) per category id
+    PRICE_RANGES = {
+        'electronics': (49.99, 2999.99),
+        'fashion': (19.99, 499.99),
+        'home_garden': (29.99, 1999.99),
+        'books': (9.99, 99.99),
+        'food': (2.99, 49.99),
+    }
+    DEFAULT_PRICE_RANGE = (9.99, 299.99)
+
+    # Sample image URLs, built once; shared by every caller, so treat as read-only
+    SAMPLE_IMAGES = {
+        'products': [f'https://picsum.photos/300/300?random={i}' for i in range(100)],
+        'banners': [f'https://picsum.photos/800/400?random=banner{i}' for i in range(10)],
+        'categories': [f'https://picsum.photos/200/200?random=cat{i}' for i in range(20)],
+        'avatars': [f'https://picsum.photos/100/100?random=avatar{i}' for i in range(50)],
+    }
+
     def __init__(self):
         super().__init__()
         self.initialize_data()
@@ -25,7 +50,9 @@ class CompleteMarketplaceMockData(BaseMockData):
         self.products = self._generate_products()
         self.users = self._generate_users()
         self.reviews = self._generate_reviews()
+        self._build_indexes()
         self.orders = self._generate_orders()
+        self.orders_by_id = {o['id']: o for o in self.orders}
         self.cart_items = self._generate_cart_items()
         self.flash_sales = self._generate_flash_sales()
         self.coupons = self._generate_coupons()
@@ -74,12 +101,7 @@ class CompleteMarketplaceMockData(BaseMockData):
 
     def get_sample_images(self):
         """Return sample image URLs"""
-        return {
-            'products': [f'https://picsum.photos/300/300?random={i}' for i in range(100)],
-            'banners': [f'https://picsum.photos/800/400?random=banner{i}' for i in range(10)],
-            'categories': [f'https://picsum.photos/200/200?random=cat{i}' for i in range(20)],
-            'avatars': [f'https://picsum.photos/100/100?random=avatar{i}' for i in range(50)],
-        }
+        return self.SAMPLE_IMAGES
 
     def _generate_categories(self):
         """Generate complete category hierarchy"""
@@ -314,9 +336,11 @@ class CompleteMarketplaceMockData(BaseMockData):
 
         # Generate products
         product_id = 1
+        uuids = _batch_uuids(2 * sum(category['productCount'] for category in self.categories))
         for category in self.categories:
             category_id = category['id']
             templates = product_templates.get(category_id, ['Product'])
+            min_price, max_price = self.PRICE_RANGES.get(category_id, self.DEFAULT_PRICE_RANGE)
 
             # Generate products for this category
             num_products = category['productCount']
@@ -325,25 +349,14 @@ class CompleteMarketplaceMockData(BaseMockData):
                 brand = random.choice(brands)
 
                 # Generate price based on category
-                if category_id == 'electronics':
-                    price = round(random.uniform(49.99, 2999.99), 2)
-                elif category_id == 'fashion':
-                    price = round(random.uniform(19.99, 499.99), 2)
-                elif category_id == 'home_garden':
-                    price = round(random.uniform(29.99, 1999.99), 2)
-                elif category_id == 'books':
-                    price = round(random.uniform(9.99, 99.99), 2)
-                elif category_id == 'food':
-                    price = round(random.uniform(2.99, 49.99), 2)
-                else:
-                    price = round(random.uniform(9.99, 299.99), 2)
+                price = round(random.uniform(min_price, max_price), 2)
 
                 # Calculate discount
                 has_discount = random.random() > 0.7
                 discount = random.choice([10, 15, 20, 25, 30, 40, 50]) if has_discount else 0
 
                 product = {
-                    'id': str(uuid.uuid4()),
+                    'id': next(uuids),
                     'productId': product_id,
                     'name': f'{brand} {template} {random.choice(["Pro", "Plus", "Elite", "Max", ""])} {random.randint(100, 999)}'.strip(),
                     'brand': brand,
@@ -361,7 +374,7 @@ class CompleteMarketplaceMockData(BaseMockData):
                     'reviews': random.randint(10, 2000),
                     'sold': random.randint(50, 5000),
                     'seller': f'Store {random.randint(1, 100)}',
-                    'sellerId': str(uuid.uuid4()),
+                    'sellerId': next(uuids),
                     'category': category['name'],
                     'categoryId': category_id,
                     'subcategory': random.choice(category['subcategories'])['name'] if category[
@@ -390,6 +403,41 @@ class CompleteMarketplaceMockData(BaseMockData):
 
         return products
 
+    def _build_indexes(self):
+        """Index products and sellers by id, products by lowercased category name and id and by seller, and reviews by product"""
+        self.products_search_text = [
+            (p.get('name', '').lower(), p.get('description', '').lower()) for p in self.products
+        ]
+        self.products_count = len(self.products)
+        self.products_by_id = {p['id']: p for p in self.products}
+        self.sellers_by_id = {s['id']: s for s in self.sellers}
+        self.products_by_category = {}
+        self.products_by_category_id = {}
+        self.products_by_seller = {}
+        for product in self.products:
+            self.products_by_category.setdefault(product['category'].lower(), []).append(product)
+            self.products_by_category_id.setdefault(product['categoryId'].lower(), []).append(product)
+            self.products_by_seller.setdefault(product['sellerId'], []).append(product)
+        self.reviews_by_product = {}
+        for review in self.reviews:
+            self.reviews_by_product.setdefault(review['productId'], []).append(review)
+        # Catalog orderings used by the product listing sort options
+        self.products_by_sort = {
+            'price_low': sorted(self.products, key=lambda x: x.get('price', 0)),
+            'price_high': sorted(self.products, key=lambda x: x.get('price', 0), reverse=True),
+            'rating': sorted(self.products, key=lambda x: x.get('rating', 0), reverse=True),
+        }
+        # Same orderings per lowercased category name; filtering a stable ordering
+        # gives the same order as sorting the category's products
+        self.products_by_category_sort = {}
+        for sort, ordered in self.products_by_sort.items():
+            for product in ordered:
+                self.products_by_category_sort.setdefault((product['category'].lower(), sort), []).append(product)
+
+    def _sample_products(self, k):
+        """Pick up to k distinct random products from the catalog"""
+        return random.sample(self.products, min(k, self.products_count))
+
     def _generate_product_description(self, template):
         """Generate product description"""
         descriptions = [
@@ -474,10 +522,11 @@ class CompleteMarketplaceMockData(BaseMockData):
             'Elite Shop', 'Premium Mart', 'Express Store', 'Global Trade'
         ]
 
+        uuids = _batch_uuids(100)
         for i in range(100):
             base_name = random.choice(seller_names)
             sellers.append({
-                'id': str(uuid.uuid4()),
+                'id': next(uuids),
                 'name': f'{base_name} {i + 1}',
                 'logo': f'https://picsum.photos/100/100?random=seller{i}',
                 'banner': f'https://picsum.photos/800/200?random=sellerbanner{i}',
@@ -588,14 +637,15 @@ class CompleteMarketplaceMockData(BaseMockData):
 
         usernames = [f'User{i}' for i in range(1, 1001)]
 
+        uuids = _batch_uuids(3 * 500)
         for i in range(500):
             product = random.choice(self.products) if self.products else None
 
             reviews.append({
-                'id': str(uuid.uuid4()),
-                'productId': product['id'] if product else str(uuid.uuid4()),
+                'id': next(uuids),
+                'productId': product['id'] if product else next(uuids),
                 'productName': product['name'] if product else 'Product',
-                'userId': str(uuid.uuid4()),
+                'userId': next(uuids),
                 'userName': random.choice(usernames),
                 'userAvatar': f'https://picsum.photos/50/50?random=user{i}',
                 'rating': random.choices([3, 4, 5], weights=[1, 3, 6])[0],
@@ -620,12 +670,17 @@ class CompleteMarketplaceMockData(BaseMockData):
         orders = []
         statuses = ['pending', 'processing', 'shipped', 'delivered', 'cancelled']
 
-        for i in range(50):
-            order_date = datetime.now() - timedelta(days=random.randint(1, 180))
+        # Draw the order ages up front, youngest first, so orders come out newest first
+        now = datetime.now()
+        ages = sorted(random.randint(1, 180) for _ in range(50))
+        uuids = _batch_uuids(len(ages))
+
+        for i, age in enumerate(ages):
+            order_date = now - timedelta(days=age)
             status = random.choice(statuses)
 
             # Select random products for order
-            order_products = random.sample(self.products, min(random.randint(1, 5), len(self.products)))
+            order_products = self._sample_products(random.randint(1, 5))
 
             items = []
             subtotal = 0
@@ -649,8 +704,9 @@ class CompleteMarketplaceMockData(BaseMockData):
             total = round(subtotal + shipping + tax, 2)
 
             orders.append({
-                'id': str(uuid.uuid4()),
-                'orderNumber': f'ORD{100000 + i}',
+                'id': next(uuids),
+                # Newest order gets the highest number
+                'orderNumber': f'ORD{100000 + len(ages) - 1 - i}',
                 'date': order_date.isoformat(),
                 'status': status,
                 'items': items,
@@ -669,12 +725,12 @@ class CompleteMarketplaceMockData(BaseMockData):
                     days=random.randint(3, 7))).isoformat() if status == 'delivered' else None
             })
 
-        return sorted(orders, key=lambda x: x['date'], reverse=True)
+        return orders
 
     def _generate_cart_items(self):
         """Generate cart items"""
         cart_items = []
-        cart_products = random.sample(self.products, min(random.randint(1, 5), len(self.products)))
+        cart_products = self._sample_products(random.randint(1, 5))
 
         for product in cart_products:
             quantity = random.randint(1, 3)
@@ -699,7 +755,7 @@ class CompleteMarketplaceMockData(BaseMockData):
     def _generate_flash_sales(self):
         """Generate flash sale items"""
         flash_sales = []
-        flash_products = random.sample(self.products, min(20, len(self.products)))
+        flash_products = self._sample_products(20)
 
         for product in flash_products:
             flash_sales.append({
@@ -719,26 +775,26 @@ class CompleteMarketplaceMockData(BaseMockData):
 
     def _get_trending_products(self):
         """Get trending products"""
-        trending = random.sample(self.products, min(30, len(self.products)))
-        for product in trending:
-            product['trendScore'] = random.randint(80, 100)
-            product['trendRank'] = random.randint(1, 100)
+        trending = [
+            {**product, 'trendScore': random.randint(80, 100), 'trendRank': random.randint(1, 100)}
+            for product in self._sample_products(30)
+        ]
         return sorted(trending, key=lambda x: x['trendScore'], reverse=True)
 
     def _get_new_arrivals(self):
         """Get new arrival products"""
-        new_arrivals = random.sample(self.products, min(40, len(self.products)))
-        for product in new_arrivals:
-            product['arrivalDate'] = (datetime.now() - timedelta(days=random.randint(1, 14))).isoformat()
-            product['isNew'] = True
+        new_arrivals = [
+            {**product, 'arrivalDate': (datetime.now() - timedelta(days=random.randint(1, 14))).isoformat(), 'isNew': True}
+            for product in self._sample_products(40)
+        ]
         return sorted(new_arrivals, key=lambda x: x['arrivalDate'], reverse=True)
 
     def _get_best_sellers(self):
         """Get best selling products"""
-        best_sellers = random.sample(self.products, min(30, len(self.products)))
-        for product in best_sellers:
-            product['soldCount'] = random.randint(100, 5000)
-            product['salesRank'] = random.randint(1, 100)
+        best_sellers = [
+            {**product, 'soldCount': random.randint(100, 5000), 'salesRank': random.randint(1, 100)}
+            for product in self._sample_products(30)
+        ]
         return sorted(best_sellers, key=lambda x: x['soldCount'], reverse=True)
 
     def _generate_deals(self):
@@ -752,7 +808,7 @@ class CompleteMarketplaceMockData(BaseMockData):
         ]
 
         for i in range(20):
-            deal_products = random.sample(self.products, min(random.randint(3, 8), len(self.products)))
+            deal_products = self._sample_products(random.randint(3, 8))
 
             deals.append({
                 'id': str(uuid.uuid4()),
@@ -808,7 +864,7 @@ class CompleteMarketplaceMockData(BaseMockData):
     def _generate_wishlist(self):
         """Generate wishlist items"""
         wishlist = []
-        wishlist_products = random.sample(self.products, min(15, len(self.products)))
+        wishlist_products = self._sample_products(15)
 
         for product in wishlist_products:
             wishlist.append({
@@ -830,7 +886,7 @@ class CompleteMarketplaceMockData(BaseMockData):
     def _generate_recently_viewed(self):
         """Generate recently viewed products"""
         viewed = []
-        viewed_products = random.sample(self.products, min(20, len(self.products)))
+        viewed_products = self._sample_products(20)
 
         for product in viewed_products:
             viewed.append({
@@ -1435,7 +1491,7 @@ class CompleteMarketplaceMockData(BaseMockData):
                 'conversionRate': f'{round(random.uniform(1, 10), 2)}%',
                 'averageOrderValue': round(random.uniform(50, 200), 2)
             },
-            'topProducts': random.sample(self.products, min(10, len(self.products))),
+            'topProducts': self._sample_products(10),
             'customerStats': {
                 'totalCustomers': random.randint(100, 5000),
                 'newCustomers': random.randint(10, 100),
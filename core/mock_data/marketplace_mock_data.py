@@ -594,7 +594,8 @@ class MarketplaceMockData(BaseMockData):
         """Get detailed product information"""
         for product in self.products:
             if product["id"] == product_id:
-                # Add additional details
+                # Add additional details to a copy, not the shared catalog entry
+                product = dict(product)
                 product["reviews"] = [r for r in self.reviews if r["productId"] == product_id]
                 product["relatedProducts"] = random.sample(self.products, min(10, len(self.products)))
                 return product
@@ -3,12 +3,30 @@
 Handlers for basic Flutter widgets.
 """
 
-from typing import Any
+import json
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping
 
 from ...base import BaseWidgetHandler, GeneratorContext
 from ...utils import DartCodeUtils, WidgetPropertyUtils
 
 
+@lru_cache(maxsize=256)
+def parse_action_parameters(raw: str) -> Mapping[str, Any]:
+    """
+    Parse an Action's JSON parameters string.
+
+    Actions often share the same parameters text, so results are cached per
+    string and returned read-only. Empty or invalid JSON yields an empty mapping.
+    """
+    try:
+        params = json.loads(raw) if raw else {}
+    except ValueError:
+        params = {}
+    return MappingProxyType(params if isinstance(params, dict) else {})
+
+
 class TextWidgetHandler(BaseWidgetHandler):
     """Handler for Text widgets."""
 
@@ -193,11 +211,7 @@ class ButtonWidgetHandler(BaseWidgetHandler):
                 title = DartCodeUtils.escape_dart_string(action.dialog_title or 'Alert')
                 message = DartCodeUtils.escape_dart_string(action.dialog_message or 'Message')
                 # Parse styling parameters
-                try:
-                    import json
-                    params = json.loads(action.parameters) if action.parameters else {}
-                except Exception:
-                    params = {}
+                params = parse_action_parameters(action.parameters)
                 bg = params.get('backgroundColor')
                 elevation = params.get('elevation')
                 border_radius = params.get('borderRadius')
@@ -230,11 +244,7 @@ class ButtonWidgetHandler(BaseWidgetHandler):
             elif action.action_type == 'show_snackbar':
                 message = DartCodeUtils.escape_dart_string(action.dialog_message or 'Done')
                 # Try to parse parameters as JSON for styling
-                try:
-                    import json
-                    params = json.loads(action.parameters) if action.parameters else {}
-                except Exception:
-                    params = {}
+                params = parse_action_parameters(action.parameters)
                 bg = params.get('backgroundColor')
                 duration_ms = params.get('durationMs')
                 padding = params.get('padding')
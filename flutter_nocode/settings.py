@@ -253,6 +253,13 @@ os.environ['PATH'] = f"{flutter_bin}{path_separator}{android_bin}{path_separator
 BUILD_TIMEOUT = config('BUILD_TIMEOUT', default=600, cast=int)
 USE_MOCK_BUILD = config('USE_MOCK_BUILD', default=False, cast=bool)
 
+# Sample app commands: insert widget properties with raw executemany instead
+# of the ORM (skips model signals, so keep off where those are needed)
+FAST_BULK = config('FAST_BULK', default=False, cast=bool)
+
+# Rows per INSERT statement when create_widgets_app bulk-creates widgets
+WIDGETS_APP_BATCH_SIZE = config('WIDGETS_APP_BATCH_SIZE', default=500, cast=int)
+
 # Debug: Print configuration
 if DEBUG:
     print(f"Flutter SDK Path: {FLUTTER_SDK_PATH}")